@@ -1,16 +1,23 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
-import time
+from functools import lru_cache
+import io
+import os
+import types
 
-# Import your classes
-try:
+@st.cache_resource(show_spinner=False)
+def _get_handler_classes():
+    """Import the scheduling stack once per server process, on first use.
+
+    The landing page renders before any shift is initialized, so it doesn't
+    pay the import cost of the handler modules up front.
+    """
     from employee_handler import EmployeeHandler
     from flight_handler import FlightHandler
     from scheduler import TeamBasedScheduler
-except ImportError as e:
-    st.error(f"Error importing modules: {e}")
-    st.stop()
+    return EmployeeHandler, FlightHandler, TeamBasedScheduler
 
 # Configure page
 st.set_page_config(
@@ -19,13 +26,272 @@ st.set_page_config(
     layout="wide"
 )
 
-# Helper function
+# Heaviness rules for Nashville operations, allocated once at import and
+# frozen so shift initialization can't mutate the source of truth
+NASHVILLE_CITY_RULES = types.MappingProxyType({
+    'DEN': 'Medium', 'LAX': 'Medium', 'EWR': 'Light', 'JFK': 'Medium',
+    'SFO': 'Medium', 'IAH': 'Medium', 'ORD': 'Light', 'SEA': 'Medium'
+})
+
+# Helper functions
+@lru_cache(maxsize=4096)
+def _flip_name_cached(full_name):
+    """Cached core of flip_name - names repeat across reruns, so split once"""
+    # Single find() + slices: the 'in' + split() pair scans the string twice
+    i = full_name.find(', ')
+    if i < 0:
+        return full_name
+    return f"{full_name[i + 2:]} {full_name[:i]}"
+
 def flip_name(full_name):
     """Convert 'LastName, FirstName' to 'FirstName LastName'"""
-    if ', ' in str(full_name):
-        last, first = full_name.split(', ', 1)
-        return f"{first} {last}"
-    return full_name
+    # Only strings are hashable-safe for the cache; pass others through
+    if not isinstance(full_name, str):
+        return full_name
+    return _flip_name_cached(full_name)
+
+def build_flight_table(flights_df):
+    """Build the flight display table with vectorized column operations (no iterrows)"""
+    # FlightHandler normalizes these columns at load time (sentinel 'N/A'
+    # values included), so a plain projection is enough here
+    disp = flights_df[
+        ['flight_number', 'outbound_flight', 'gate', 'city', 'outbound_city', 'heaviness']
+    ].rename(columns={
+        'flight_number': 'Arrival Flight #',
+        'outbound_flight': 'Departure Flight #',
+        'gate': 'Gate',
+        'city': 'Inbound City',
+        'outbound_city': 'Outbound City',
+        'heaviness': 'Heaviness'
+    })
+
+    # Ship raw datetime64 columns and let the client format them via
+    # column_config - 8 bytes per value over Arrow instead of a string.
+    # Fall back to the precomputed HH:MM strings for frames without them.
+    if 'eta_datetime' in flights_df.columns:
+        disp['ETA'] = flights_df['eta_datetime']
+    elif 'eta_hhmm' in flights_df.columns:
+        disp['ETA'] = flights_df['eta_hhmm']
+    else:
+        disp['ETA'] = 'N/A'
+    if 'etd_datetime' in flights_df.columns:
+        disp['ETD'] = flights_df['etd_datetime']
+    elif 'etd_hhmm' in flights_df.columns:
+        disp['ETD'] = flights_df['etd_hhmm']
+    else:
+        disp['ETD'] = 'N/A'
+
+    return disp[['Arrival Flight #', 'Departure Flight #', 'Gate', 'ETA', 'ETD',
+                 'Inbound City', 'Outbound City', 'Heaviness']]
+
+# st.fragment landed in 1.37; fall back to the experimental name on older installs
+_fragment = getattr(st, 'fragment', None) or st.experimental_fragment
+
+@_fragment
+def _render_notification(notification):
+    """Render one notification card in its own fragment.
+
+    Approve/Reject inside the fragment rerun only this card instead of
+    rebuilding every tab on the page.
+    """
+    scheduler = st.session_state.scheduler
+    formatted = scheduler.notification_system.format_notification(notification)
+
+    with st.container():
+        # Emit the whole notification body as one markdown delta
+        detail_lines = "\n".join(
+            f"- **{key}:** {value}" for key, value in formatted['details'].items()
+        )
+        st.markdown(
+            f"### {formatted['title']}\n"
+            f"**Time:** {formatted['time']}\n\n"
+            f"{formatted['message']}\n\n"
+            f"{detail_lines}"
+        )
+
+        # Approval actions
+        col1, col2, col3 = st.columns([2, 1, 1])
+
+        # Manual team selection for new employees
+        manual_team = None
+        if formatted.get('allow_manual_selection'):
+            with col1:
+                manual_team = st.selectbox(
+                    "Assign to Team:",
+                    list(scheduler.team_manager.teams.keys()),
+                    key=f"team_select_{notification['id']}"
+                )
+
+        with col2:
+            if st.button("✅ Approve", key=f"approve_{notification['id']}"):
+                success, msg = scheduler.approve_team_change(
+                    notification['id'],
+                    manual_team_assignment=manual_team
+                )
+                if success:
+                    st.success("Approved!")
+                    st.rerun(scope="fragment")
+                else:
+                    st.error(msg)
+
+        with col3:
+            if st.button("❌ Reject", key=f"reject_{notification['id']}"):
+                scheduler.notification_system.reject_notification(notification['id'])
+                st.warning("Rejected")
+                st.rerun(scope="fragment")
+
+        st.divider()
+
+# Client-side HH:mm rendering for the raw datetime display columns
+_TIME_COLUMN_CONFIG = {
+    'ETA': st.column_config.DatetimeColumn(format='HH:mm'),
+    'ETD': st.column_config.DatetimeColumn(format='HH:mm'),
+}
+
+# Key cached frames by identity+shape - Streamlit's default deep hash
+# walks every byte of the DataFrame on each cache lookup
+_DF_HASH_FUNCS = {pd.DataFrame: lambda df: (id(df), df.shape)}
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
+def _preapproval_table(flights_df):
+    """Memoized pre-approval flight table.
+
+    hash_funcs keys the frame on (id, shape), so widget interactions hit
+    the cache without re-hashing the whole frame.
+    """
+    return build_flight_table(flights_df)
+
+def _parquet_sidecar(csv_path, handler_cls):
+    """Prefer a typed .parquet sibling of the CSV, creating it on first load.
+
+    Falls back to the CSV path if pyarrow isn't available or conversion fails.
+    """
+    pq_path = os.path.splitext(csv_path)[0] + '.parquet'
+    try:
+        if os.path.exists(pq_path) and os.path.getmtime(pq_path) >= os.path.getmtime(csv_path):
+            return pq_path
+        if handler_cls.preprocess_to_parquet(csv_path, pq_path):
+            return pq_path
+    except Exception:
+        pass
+    return csv_path
+
+@st.cache_data(show_spinner=False)
+def _load_employees_df(path, mtime):
+    """Parse the employee file once per (path, mtime); reruns get the cached frame"""
+    EmployeeHandler, _, _ = _get_handler_classes()
+    handler = EmployeeHandler()
+    handler.load_employees(_parquet_sidecar(path, EmployeeHandler))
+    return handler.employees_df
+
+@st.cache_data(show_spinner=False)
+def _load_flights_df(path, mtime):
+    """Parse the flight file once per (path, mtime); reruns get the cached frame"""
+    _, FlightHandler, _ = _get_handler_classes()
+    handler = FlightHandler()
+    handler.load_flights(_parquet_sidecar(path, FlightHandler))
+    return handler.flights_df
+
+@st.cache_data(show_spinner=False)
+def _assignments_view(view_key):
+    """One cached pass over scheduler.assignments, shared by every tab.
+
+    Returns (schedule table, member-detail table, team -> assignments
+    index) so a rerun touches the assignment list once instead of once
+    per tab. view_key is (id(scheduler), assignment count).
+    """
+    scheduler = st.session_state.scheduler
+    assignments = scheduler.assignments
+    if not assignments:
+        return pd.DataFrame(), pd.DataFrame(), {}
+
+    # The per-team index is maintained incrementally by the scheduler;
+    # copy it so the cached value can't alias live state
+    by_team = {team: list(items) for team, items in scheduler.assignments_by_team.items()}
+
+    # Tidy member-detail rows in one walk
+    detail_rows = []
+    for a in assignments:
+        team = a['team_assigned']
+        if not (a.get('assignment_success') and team):
+            continue
+        eta = a['eta']
+        etd = a['etd']
+        eta_str = eta.strftime('%H:%M') if hasattr(eta, 'strftime') else str(eta)
+        etd_str = etd.strftime('%H:%M') if hasattr(etd, 'strftime') else str(etd)
+        for rank, member in enumerate(a['team_members'], 1):
+            detail_rows.append((team, a['flight_id'], rank, flip_name(member), a['flight_route'],
+                                eta_str, etd_str, a['gate'], a['heaviness'], a.get('aircraft', 'N/A')))
+
+    detail_df = pd.DataFrame(detail_rows, columns=['Team', 'Flight', '#', 'Member', 'Route',
+                                                   'ETA', 'ETD', 'Gate', 'Heaviness', 'Aircraft'])
+    detail_df = detail_df.sort_values(['Team', 'Flight', '#'])
+
+    # Schedule table, vectorized from the records
+    flight_df = pd.DataFrame.from_records(assignments)
+    flight_df['ETA'] = pd.to_datetime(flight_df['eta'], errors='coerce')
+    flight_df['ETD'] = pd.to_datetime(flight_df['etd'], errors='coerce')
+    flight_df['Status'] = np.where(flight_df['assignment_success'], '✅ Assigned', '❌ Unassigned')
+    flight_df['Ramp Team'] = flight_df['team_assigned'].fillna('UNASSIGNED')
+    flight_df = flight_df.reindex(
+        columns=['flight_id', 'outbound_flight', 'gate', 'ETA', 'ETD',
+                 'inbound_city', 'outbound_city', 'heaviness', 'Ramp Team', 'Status'],
+        fill_value='N/A'
+    ).rename(columns={
+        'flight_id': 'Arrival Flight #',
+        'outbound_flight': 'Departure Flight #',
+        'gate': 'Gate',
+        'inbound_city': 'Inbound City',
+        'outbound_city': 'Outbound City',
+        'heaviness': 'Heaviness'
+    })
+
+    return flight_df, detail_df, by_team
+
+@_fragment
+def _render_team_card(team_name, team_data, team_flights):
+    """Team status expander, isolated in its own fragment"""
+    with st.expander(f"Team {team_name} - {team_data['size']} members - {team_data['flight_count']} flights"):
+        # Single markdown delta per team expander
+        member_lines = "\n".join(
+            f"- {flip_name(name)}" for name in team_data['member_names']
+        )
+        body = (
+            f"**Members:**\n{member_lines}\n\n"
+            f"**Status:** {team_data.get('current_status', 'Available')}\n\n"
+            f"**Flights Completed:** {team_data['flight_count']}"
+        )
+
+        if team_flights:
+            flight_lines = "\n".join(
+                f"- Flight {a['flight_id']} ({a['flight_route']})"
+                for a in team_flights
+            )
+            body += f"\n\n**Assigned Flights:**\n{flight_lines}"
+
+        st.markdown(body)
+
+@st.cache_data(show_spinner=False)
+def _df_to_csv_bytes(view_key, _df):
+    """Encode the schedule frame to CSV bytes once per assignments view.
+
+    _assignments_view returns a fresh pickle-copy per rerun, so identity
+    hashing would miss (and pile up an entry) every time; the leading
+    underscore excludes the frame from hashing and view_key - the same
+    (id(scheduler), assignment count) pair the view is cached on - keys
+    the bytes instead.
+    """
+    buf = io.BytesIO()
+    _df.to_csv(buf, index=False)
+    return buf.getvalue()
+
+@st.cache_data(show_spinner=False)
+def _cached_schedule_summary(n_assignments, current_time):
+    """Memoized schedule summary - only recomputed when assignments or sim time change.
+
+    The args are just the cache key; the scheduler itself lives in session state.
+    """
+    return st.session_state.scheduler.get_schedule_summary()
 
 # Initialize session state
 if 'scheduler' not in st.session_state:
@@ -46,49 +312,62 @@ st.sidebar.header("Control Panel")
 
 # Initialize system
 if st.sidebar.button("Initialize New Shift", type="primary"):
-    with st.spinner("Loading data and initializing teams..."):
+    # st.status streams progress per step instead of freezing behind a
+    # single opaque spinner. The work stays in-process: handing it to a
+    # ProcessPoolExecutor would pickle the handlers' DataFrames both ways,
+    # and with file loads cached on (path, mtime) the init is too short to
+    # amortize that.
+    with st.status("Initializing shift...", expanded=True) as status:
         try:
-            # Load handlers
-            employee_handler = EmployeeHandler()
-            flight_handler = FlightHandler()
-            
-            employee_success = employee_handler.load_employees("../data/employees.csv")
-            flight_success = flight_handler.load_flights("../data/flights.csv")
-            
-            if not employee_success or not flight_success:
+            EmployeeHandler, FlightHandler, TeamBasedScheduler = _get_handler_classes()
+
+            # Load handlers - CSV parsing is cached on (path, mtime), so
+            # re-initializing a shift with unchanged files is a cache hit
+            st.write("Loading employee and flight data...")
+            emp_path = "../data/employees.csv"
+            flt_path = "../data/flights.csv"
+            employee_handler = EmployeeHandler.from_dataframe(
+                _load_employees_df(emp_path, os.path.getmtime(emp_path))
+            )
+            flight_handler = FlightHandler.from_dataframe(
+                _load_flights_df(flt_path, os.path.getmtime(flt_path))
+            )
+
+            if employee_handler.employees_df is None or flight_handler.flights_df is None:
+                status.update(label="Initialization failed", state="error")
                 st.error("Failed to load CSV files")
             else:
                 # Apply heaviness rules
-                nashville_rules = {
-                    'DEN': 'Medium', 'LAX': 'Medium', 'EWR': 'Light', 'JFK': 'Medium',
-                    'SFO': 'Medium', 'IAH': 'Medium', 'ORD': 'Light', 'SEA': 'Medium'
-                }
-                flight_handler.set_manual_heaviness_by_city(nashville_rules)
-                
+                flight_handler.set_manual_heaviness_by_city(NASHVILLE_CITY_RULES)
+
                 # Create scheduler
                 scheduler = TeamBasedScheduler(employee_handler, flight_handler)
-                
+
                 # Set shift start time (get from first employee start time)
                 shift_start = employee_handler.employees_df['start'].min()
-                
+
                 # Initialize teams
+                st.write("Forming teams...")
                 success, remainder = scheduler.initialize_shift(shift_start)
-                
+
                 if success:
                     st.session_state.scheduler = scheduler
                     st.session_state.shift_start_time = shift_start
                     st.session_state.current_time = shift_start
                     st.session_state.teams_approved = False
-                    
+
                     if remainder:
                         st.warning(f"{len(remainder)} employees need team assignment")
-                    
+
+                    status.update(label="Teams formed", state="complete")
                     st.success("Teams formed! Please review and approve.")
                     st.rerun()
                 else:
+                    status.update(label="Initialization failed", state="error")
                     st.error("Failed to initialize teams")
-        
+
         except Exception as e:
+            status.update(label="Initialization failed", state="error")
             st.error(f"Error: {str(e)}")
 
 # Main content
@@ -114,23 +393,11 @@ else:
         st.subheader("Today's Flight Schedule")
         
         flights_df = scheduler.flight_handler.flights_df
-        
-        # Create display table
-        flight_table_data = []
-        for _, flight in flights_df.iterrows():
-            flight_table_data.append({
-                'Arrival Flight #': flight['flight_number'],
-                'Departure Flight #': flight.get('outbound_flight', 'N/A'),
-                'Gate': flight.get('gate', 'N/A'),
-                'ETA': flight['eta_datetime'].strftime('%H:%M') if hasattr(flight['eta_datetime'], 'strftime') else str(flight.get('eta', 'N/A')),
-                'ETD': flight['etd_datetime'].strftime('%H:%M') if hasattr(flight['etd_datetime'], 'strftime') else str(flight.get('etd', 'N/A')),
-                'Inbound City': flight.get('city', 'N/A'),
-                'Outbound City': flight.get('outbound_city', 'N/A'),
-                'Heaviness': flight.get('heaviness', 'Medium')
-            })
-        
-        flight_table_df = pd.DataFrame(flight_table_data)
-        st.dataframe(flight_table_df, use_container_width=True, hide_index=True)
+
+        # Create display table (cached - selectbox interactions don't rebuild it)
+        flight_table_df = _preapproval_table(flights_df)
+        st.dataframe(flight_table_df, use_container_width=True, hide_index=True,
+                     column_config=_TIME_COLUMN_CONFIG)
         
         st.divider()
         
@@ -138,27 +405,29 @@ else:
         st.subheader("Proposed Ramp Teams")
         
         teams = scheduler.team_manager.teams
-        
-<<<<<<< HEAD
+        team_names = tuple(teams.keys())
+
+        # Display name -> employee_id lookup per team (O(1) instead of scanning members)
+        name_to_id = {
+            team: {flip_name(m['employee_name']): m['employee_id'] for m in td['members']}
+            for team, td in teams.items()
+        }
+
         # Display proposed teams
-=======
->>>>>>> d0302a760712868c0ae3479513f7e1d11cbd12c1
         if len(teams) == 0:
             st.error("No teams were formed. Check if employees are available at shift start time.")
         else:
-            cols = st.columns(len(teams))
-            for idx, (team_name, team_data) in enumerate(teams.items()):
-                with cols[idx]:
-<<<<<<< HEAD
-                    st.subheader(f"Team {team_name}")
-                    st.write(f"**Size:** {team_data['size']} members")
-=======
-                    st.markdown(f"**Team {team_name}**")
-                    st.write(f"Size: {team_data['size']} members")
->>>>>>> d0302a760712868c0ae3479513f7e1d11cbd12c1
-                    
-                    for i, member_name in enumerate(team_data['member_names'], 1):
-                        st.write(f"{i}. {flip_name(member_name)}")
+            # Render all teams as one table (one Arrow transfer) instead of
+            # a column of per-member deltas per team
+            roster = {
+                f"Team {team} ({td['size']})": [flip_name(name) for name in td['member_names']]
+                for team, td in teams.items()
+            }
+            max_size = max(len(members) for members in roster.values())
+            for members in roster.values():
+                members.extend([''] * (max_size - len(members)))
+
+            st.dataframe(pd.DataFrame(roster), use_container_width=True, hide_index=True)
         
         # Manual team adjustment
         st.divider()
@@ -170,20 +439,19 @@ else:
             employee_id = None  # Initialize outside the block
             
             with col1:
-                from_team = st.selectbox("From Team:", list(teams.keys()), key="from_team")
+                from_team = st.selectbox("From Team:", team_names, key="from_team")
             with col2:
                 # Get members of selected team
                 if from_team in teams:
-                    member_names = [flip_name(m) for m in teams[from_team]['member_names']]
+                    member_names = list(name_to_id[from_team].keys())
                     if member_names:  # Check if team has members
                         selected_member = st.selectbox("Employee:", member_names, key="employee_move")
-                        # Find the employee_id for the selected name
-                        for member in teams[from_team]['members']:
-                            if flip_name(member['employee_name']) == selected_member:
-                                employee_id = member['employee_id']
-                                break
+                        # O(1) lookup of the employee_id for the selected name
+                        employee_id = name_to_id[from_team].get(selected_member)
             with col3:
-                to_team = st.selectbox("To Team:", [t for t in teams.keys() if t != from_team], key="to_team")
+                # Slice around from_team instead of re-filtering per rerun
+                i = team_names.index(from_team)
+                to_team = st.selectbox("To Team:", team_names[:i] + team_names[i + 1:], key="to_team")
             
             if st.button("Swap Employee"):
                 if employee_id:
@@ -215,18 +483,28 @@ else:
             with col1:
                 st.write(f"**Current Time:** {st.session_state.current_time.strftime('%Y-%m-%d %H:%M')}")
             with col2:
-                if st.button("Advance 5 Minutes"):
-                    st.session_state.current_time += timedelta(minutes=5)
-                    # Check for team changes
-                    scheduler.check_for_team_changes(st.session_state.current_time)
+                advance_mins = st.number_input("Minutes to advance", min_value=5, step=5, value=5, key="advance_mins")
+                if st.button("Advance Time"):
+                    # Walk in 5-minute steps so the window-based change
+                    # detection still sees each interval, but do it all in
+                    # one rerun instead of one full re-render per click
+                    for _ in range(int(advance_mins) // 5):
+                        st.session_state.current_time += timedelta(minutes=5)
+                        scheduler.check_for_team_changes(st.session_state.current_time)
                     st.rerun()
             with col3:
                 if st.button("Assign Flights"):
-                    scheduler.assign_flights_in_window(st.session_state.current_time, window_hours=4)
+                    # Skip the O(flights x teams) pass if nothing changed
+                    # since the last click (same time, same assignments)
+                    now = st.session_state.current_time
+                    assign_key = (now, len(scheduler.assignments))
+                    if st.session_state.get('_last_assign_key') != assign_key:
+                        scheduler.assign_flights_in_window(now, window_hours=4)
+                        st.session_state._last_assign_key = (now, len(scheduler.assignments))
                     st.rerun()
             
             # Metrics
-            summary = scheduler.get_schedule_summary()
+            summary = _cached_schedule_summary(len(scheduler.assignments), st.session_state.current_time)
             col1, col2, col3, col4 = st.columns(4)
             col1.metric("Total Flights", summary['total_flights'])
             col2.metric("Assigned Flights", summary['assigned_flights'])
@@ -237,83 +515,42 @@ else:
             st.header("Flight Schedule with Team Assignments")
             
             if scheduler.assignments:
-                flight_data = []
-                for assignment in scheduler.assignments:
-                    eta_str = assignment['eta'].strftime('%H:%M') if hasattr(assignment['eta'], 'strftime') else 'N/A'
-                    etd_str = assignment['etd'].strftime('%H:%M') if hasattr(assignment['etd'], 'strftime') else 'N/A'
-                    
-                    flight_data.append({
-                        'Arrival Flight #': assignment['flight_id'],
-                        'Departure Flight #': assignment.get('outbound_flight', 'N/A'),
-                        'Gate': assignment['gate'],
-                        'ETA': eta_str,
-                        'ETD': etd_str,
-                        'Inbound City': assignment['inbound_city'],
-                        'Outbound City': assignment['outbound_city'],
-                        'Heaviness': assignment['heaviness'],
-                        'Ramp Team': assignment['team_assigned'] if assignment['team_assigned'] else 'UNASSIGNED',
-                        'Status': '✅ Assigned' if assignment['assignment_success'] else '❌ Unassigned'
-                    })
-                
-                flight_df = pd.DataFrame(flight_data)
-                st.dataframe(flight_df, use_container_width=True, hide_index=True)
+                # Single cached pass over the assignment records
+                flight_df, detail_df, _ = _assignments_view((id(scheduler), len(scheduler.assignments)))
+                st.dataframe(flight_df, use_container_width=True, hide_index=True,
+                             column_config=_TIME_COLUMN_CONFIG)
                 
-                # Show team member details for each flight
+                # Show team member details for each flight as one table
                 st.divider()
                 st.subheader("Team Details by Flight")
+
+                st.dataframe(detail_df, use_container_width=True, hide_index=True)
                 
-                for assignment in scheduler.assignments:
-                    if assignment['assignment_success'] and assignment['team_assigned']:
-                        with st.expander(f"Flight {assignment['flight_id']} - Team {assignment['team_assigned']} - {assignment['inbound_city']}→{assignment['outbound_city']}"):
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.write(f"**Gate:** {assignment['gate']}")
-                                st.write(f"**Time:** {assignment['eta'].strftime('%H:%M')} - {assignment['etd'].strftime('%H:%M')}")
-                            with col2:
-                                st.write(f"**Heaviness:** {assignment['heaviness']}")
-                                st.write(f"**Aircraft:** {assignment.get('aircraft', 'N/A')}")
-                            
-                            st.write("**Team Members:**")
-                            for member in assignment['team_members']:
-                                st.write(f"• {flip_name(member)}")
-                
-                if st.button("Export Schedule"):
-                    scheduler.export_schedule()
-                    st.success("Schedule exported!")
+                # In-memory download instead of a server-side file write;
+                # the CSV bytes are cached per unique frame
+                st.download_button(
+                    "📥 Export Schedule",
+                    data=_df_to_csv_bytes((id(scheduler), len(scheduler.assignments)), flight_df),
+                    file_name="team_schedule.csv",
+                    mime="text/csv"
+                )
             else:
                 st.info("No flights assigned yet. Click 'Assign Flights' in the Dashboard tab to begin.")
                 
                 # Show unassigned flights
                 st.subheader("Unassigned Flights")
-                flights_df = scheduler.flight_handler.flights_df
-                
-                flight_table_data = []
-                for _, flight in flights_df.iterrows():
-                    flight_table_data.append({
-                        'Arrival Flight #': flight['flight_number'],
-                        'Departure Flight #': flight.get('outbound_flight', 'N/A'),
-                        'Gate': flight.get('gate', 'N/A'),
-                        'ETA': flight['eta_datetime'].strftime('%H:%M') if hasattr(flight['eta_datetime'], 'strftime') else str(flight.get('eta', 'N/A')),
-                        'ETD': flight['etd_datetime'].strftime('%H:%M') if hasattr(flight['etd_datetime'], 'strftime') else str(flight.get('etd', 'N/A')),
-                        'Inbound City': flight.get('city', 'N/A'),
-                        'Outbound City': flight.get('outbound_city', 'N/A'),
-                        'Heaviness': flight.get('heaviness', 'Medium')
-                    })
-                
-                flight_table_df = pd.DataFrame(flight_table_data)
-                st.dataframe(flight_table_df, use_container_width=True, hide_index=True)
+                flight_table_df = build_flight_table(scheduler.flight_handler.flights_df)
+                st.dataframe(flight_table_df, use_container_width=True, hide_index=True,
+                             column_config=_TIME_COLUMN_CONFIG)
         
         with tab3:
             st.header("Team Status")
-            
+
+            # The team index comes from the shared cached pass
+            _, _, assignments_by_team = _assignments_view((id(scheduler), len(scheduler.assignments)))
+
             for team_name, team_data in scheduler.team_manager.teams.items():
-                with st.expander(f"Team {team_name} - {team_data['size']} members - {team_data['flight_count']} flights"):
-                    st.write("**Members:**")
-                    for member_name in team_data['member_names']:
-                        st.write(f"- {flip_name(member_name)}")
-                    
-                    st.write(f"**Status:** {team_data.get('current_status', 'Available')}")
-                    st.write(f"**Flights Completed:** {team_data['flight_count']}")
+                _render_team_card(team_name, team_data, assignments_by_team.get(team_name))
         
         with tab4:
             st.header("Notification Center")
@@ -326,51 +563,7 @@ else:
                 st.write(f"**{len(pending)} pending notification(s)**")
                 
                 for notification in pending:
-                    formatted = scheduler.notification_system.format_notification(notification)
-                    
-                    with st.container():
-                        st.markdown(f"### {formatted['title']}")
-                        st.write(f"**Time:** {formatted['time']}")
-                        st.info(formatted['message'])
-                        
-                        # Show details
-                        cols = st.columns(2)
-                        for idx, (key, value) in enumerate(formatted['details'].items()):
-                            with cols[idx % 2]:
-                                st.write(f"**{key}:** {value}")
-                        
-                        # Approval actions
-                        col1, col2, col3 = st.columns([2, 1, 1])
-                        
-                        # Manual team selection for new employees
-                        manual_team = None
-                        if formatted.get('allow_manual_selection'):
-                            with col1:
-                                manual_team = st.selectbox(
-                                    "Assign to Team:",
-                                    list(scheduler.team_manager.teams.keys()),
-                                    key=f"team_select_{notification['id']}"
-                                )
-                        
-                        with col2:
-                            if st.button("✅ Approve", key=f"approve_{notification['id']}"):
-                                success, msg = scheduler.approve_team_change(
-                                    notification['id'],
-                                    manual_team_assignment=manual_team
-                                )
-                                if success:
-                                    st.success("Approved!")
-                                    st.rerun()
-                                else:
-                                    st.error(msg)
-                        
-                        with col3:
-                            if st.button("❌ Reject", key=f"reject_{notification['id']}"):
-                                scheduler.notification_system.reject_notification(notification['id'])
-                                st.warning("Rejected")
-                                st.rerun()
-                        
-                        st.divider()
+                    _render_notification(notification)
 
 # Footer
 st.markdown("---")
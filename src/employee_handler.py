@@ -2,16 +2,112 @@ import pandas as pd
 from datetime import datetime
 import numpy as np
 
+# pyarrow's CSV reader tokenizes with SIMD C++ instead of pandas' parser;
+# fall back to pd.read_csv when it isn't installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+def _flip_name(full_name):
+    """Convert 'LastName, FirstName' to 'FirstName LastName'"""
+    if not isinstance(full_name, str):
+        return full_name
+    i = full_name.find(', ')
+    if i < 0:
+        return full_name
+    return f"{full_name[i + 2:]} {full_name[:i]}"
+
 class EmployeeHandler:
     def __init__(self):
         self.employees_df = None
-        self.workload_tracker = {}
-        
+        # NumPy views over the availability columns (built after load);
+        # _workload is the per-employee flight count, aligned with them
+        self._emp_ids = None
+        self._start = None
+        self._end = None
+        self._max_flights = None
+        self._workload = None
+        self._order = None
+        self._id_to_idx = {}
+        self._record_cache = {}
+
+    def _build_arrays(self):
+        """Cache NumPy views of the availability columns.
+
+        find_available_employees runs once per flight, so keep the shift
+        windows, capacities and workloads as flat arrays for a single
+        vectorized mask instead of per-row DataFrame lookups.
+        """
+        df = self.employees_df
+        start = df['start'].to_numpy(dtype='datetime64[ns]')
+
+        # Keep the arrays sorted by shift start so availability checks can
+        # binary-search the prefix of shifts that begin early enough;
+        # _order maps sorted positions back to DataFrame row positions
+        self._order = np.argsort(start, kind='stable')
+        self._start = start[self._order]
+        self._end = df['end'].to_numpy(dtype='datetime64[ns]')[self._order]
+        self._max_flights = df['max_flights_per_day'].to_numpy()[self._order]
+        self._emp_ids = df['employee_id'].to_numpy()[self._order]
+        self._workload = np.zeros(len(self._emp_ids), dtype=np.int32)
+        self._id_to_idx = {emp_id: i for i, emp_id in enumerate(self._emp_ids)}
+        self._record_cache = {}
+
+    @classmethod
+    def from_dataframe(cls, employees_df):
+        """Build a handler around an already-parsed employee DataFrame.
+
+        Lets callers (e.g. the dashboard's cached CSV loader) skip the
+        parse entirely while still getting workload tracking set up.
+        """
+        handler = cls()
+        handler.employees_df = employees_df
+        if employees_df is not None:
+            handler._build_arrays()
+        return handler
+
+    @staticmethod
+    def preprocess_to_parquet(csv_path, out_path):
+        """One-time conversion of the employee CSV to typed Parquet.
+
+        Loading the .parquet afterwards skips CSV tokenization and the
+        per-cell datetime parsing entirely.
+        """
+        handler = EmployeeHandler()
+        if not handler.load_employees(csv_path):
+            return False
+        handler.employees_df.to_parquet(out_path, engine='pyarrow', index=False)
+        return True
+
+    @staticmethod
+    def _read_csv(file_path):
+        """Read the CSV via pyarrow's typed reader when available"""
+        if pacsv is None:
+            return pd.read_csv(file_path)
+
+        # Explicit schema skips type inference; the time columns stay
+        # strings because they're combined with Date downstream
+        convert_options = pacsv.ConvertOptions(column_types={
+            'Date': pa.string(),
+            'Start': pa.string(),
+            'End': pa.string(),
+            'Hours': pa.float32(),
+        })
+        return pacsv.read_csv(file_path, convert_options=convert_options).to_pandas()
+
     def load_employees(self, file_path="employees.csv"):
-        """Load employee data from your CSV file"""
+        """Load employee data from your CSV (or preprocessed Parquet/Feather) file"""
         try:
-            # Load the CSV
-            self.employees_df = pd.read_csv(file_path)
+            # Parquet/Feather carry dtypes, so the datetime work below is skipped
+            if file_path.endswith('.parquet'):
+                self.employees_df = pd.read_parquet(file_path, engine='pyarrow')
+            elif file_path.endswith('.feather'):
+                self.employees_df = pd.read_feather(file_path)
+            else:
+                self.employees_df = self._read_csv(file_path)
             
             # Handle your actual column names from the website
             column_mapping = {
@@ -29,26 +125,34 @@ class EmployeeHandler:
             # Rename columns to match our internal structure
             self.employees_df = self.employees_df.rename(columns=column_mapping)
             
-            # Remove rows where employee_name is empty or contains special markers like ---EMPTY---
-            self.employees_df = self.employees_df[self.employees_df['employee_name'].notna()]
-            self.employees_df = self.employees_df[~self.employees_df['employee_name'].str.contains('EMPTY', na=False, case=False)]
+            # Remove rows where employee_name is empty or contains special markers
+            # like ---EMPTY---; one combined mask, with regex=False so the
+            # substring scan skips the regex engine entirely
+            names = self.employees_df['employee_name']
+            mask = names.notna() & ~names.str.contains('EMPTY', case=False, regex=False, na=False)
+            self.employees_df = self.employees_df[mask]
             
             # Combine Date with Start and End times to create full datetime
             # Your format: Date column (9/13/2025) + Start column (9:00:00 AM) or (12:00:00 PM)
-            if 'date' in self.employees_df.columns and 'start_time' in self.employees_df.columns:
-                # Create full datetime strings
+            if 'start' in self.employees_df.columns and pd.api.types.is_datetime64_any_dtype(self.employees_df['start']):
+                # Already typed (preprocessed Parquet/Feather) - nothing to parse
+                pass
+            elif 'date' in self.employees_df.columns and 'start_time' in self.employees_df.columns:
+                # Create full datetime strings. The explicit format keeps
+                # pandas on the fast C parse path instead of inferring per
+                # row; cache=True dedupes the repeated shift timestamps.
                 self.employees_df['start'] = pd.to_datetime(
                     self.employees_df['date'].astype(str) + ' ' + self.employees_df['start_time'].astype(str),
-                    errors='coerce'
+                    format='%m/%d/%Y %I:%M:%S %p', errors='coerce', cache=True
                 )
                 self.employees_df['end'] = pd.to_datetime(
                     self.employees_df['date'].astype(str) + ' ' + self.employees_df['end_time'].astype(str),
-                    errors='coerce'
+                    format='%m/%d/%Y %I:%M:%S %p', errors='coerce', cache=True
                 )
             else:
                 # Fallback if format is different
-                self.employees_df['start'] = pd.to_datetime(self.employees_df['start_time'], errors='coerce')
-                self.employees_df['end'] = pd.to_datetime(self.employees_df['end_time'], errors='coerce')
+                self.employees_df['start'] = pd.to_datetime(self.employees_df['start_time'], errors='coerce', cache=True)
+                self.employees_df['end'] = pd.to_datetime(self.employees_df['end_time'], errors='coerce', cache=True)
             
             # Remove any rows with invalid datetime conversions
             self.employees_df = self.employees_df.dropna(subset=['start', 'end'])
@@ -65,9 +169,15 @@ class EmployeeHandler:
                 else:
                     self.employees_df['max_flights_per_day'] = 10  # Default
             
-            # Initialize workload tracking
-            self.workload_tracker = {emp_id: 0 for emp_id in self.employees_df['employee_id']}
-            
+            # Low-cardinality string columns as category - shrinks memory and
+            # the Arrow payload when frames are shown in the dashboard
+            for col in ('position', 'group'):
+                if col in self.employees_df.columns:
+                    self.employees_df[col] = self.employees_df[col].astype('category')
+
+            # Build the cached arrays (includes zeroed workload tracking)
+            self._build_arrays()
+
             print("✓ Employee data loaded successfully!")
             print(f"  Total employees: {len(self.employees_df)}")
             print(f"  Date/Time range: {self.employees_df['start'].min()} to {self.employees_df['end'].max()}")
@@ -133,50 +243,71 @@ class EmployeeHandler:
         if isinstance(flight_end, str):
             flight_end = pd.to_datetime(flight_end)
         
-        # Your existing availability logic
-        available_employees = self.employees_df[
-            (self.employees_df['start'] <= flight_start) &
-            (self.employees_df['end'] >= flight_end)
-        ]
-        
-        # Also filter by workload capacity
-        available_with_capacity = available_employees[
-            available_employees['employee_id'].map(
-                lambda x: self.workload_tracker[x] < self.employees_df[self.employees_df['employee_id'] == x]['max_flights_per_day'].iloc[0]
-            )
-        ]
-        
-        return available_with_capacity
+        # Arrays are sorted by shift start, so only the prefix with
+        # start <= flight_start can match: find it in O(log N), then mask
+        # just those candidates on end time and remaining capacity
+        hi = np.searchsorted(self._start, np.datetime64(flight_start), side='right')
+        mask = (
+            (self._end[:hi] >= np.datetime64(flight_end)) &
+            (self._workload[:hi] < self._max_flights[:hi])
+        )
+        return self.employees_df.iloc[self._order[:hi][mask]]
     
+    def get_employee_record(self, employee_id):
+        """O(1) lookup of one employee's record dict by id.
+
+        Replaces the boolean-scan + iloc[0] pattern, which allocates a
+        filtered frame just to read a single row.
+        """
+        record = self._record_cache.get(employee_id)
+        if record is None:
+            idx = self._id_to_idx.get(employee_id)
+            if idx is None:
+                return None
+            record = self.employees_df.iloc[self._order[idx]].to_dict()
+            self._record_cache[employee_id] = record
+        # Copy so callers (e.g. team rosters) can't alias the cached dict
+        return dict(record)
+
     def assign_flight_to_employee(self, employee_id):
         """Assign a flight to an employee (increment their workload)"""
-        if employee_id in self.workload_tracker:
-            self.workload_tracker[employee_id] += 1
+        idx = self._id_to_idx.get(employee_id)
+        if idx is not None:
+            self._workload[idx] += 1
             return True
         return False
-    
+
     def reset_workload(self):
         """Reset all employee workloads to 0"""
-        self.workload_tracker = {emp_id: 0 for emp_id in self.employees_df['employee_id']}
+        if self._workload is not None:
+            self._workload.fill(0)
         print("✓ Employee workloads reset")
     
-    def get_workload_summary(self):
-        """Get current workload summary"""
+    def get_workload_summary(self, display=False):
+        """Get current workload summary
+
+        Args:
+            display: if True, return display-ready values (names flipped to
+                     'FirstName LastName', utilization rounded to 1 decimal)
+                     so callers can render the frame without copying it
+        """
         if self.employees_df is None:
             return None
-        
-        workload_data = []
-        for _, employee in self.employees_df.iterrows():
-            emp_id = employee['employee_id']
-            workload_data.append({
-                'employee_id': emp_id,
-                'employee_name': employee.get('employee_name', 'Unknown'),
-                'current_flights': self.workload_tracker[emp_id],
-                'max_flights': employee['max_flights_per_day'],
-                'utilization_pct': (self.workload_tracker[emp_id] / employee['max_flights_per_day']) * 100
-            })
-        
-        return pd.DataFrame(workload_data)
+
+        names = self.employees_df['employee_name'].to_numpy()[self._order]
+        utilization = self._workload / self._max_flights * 100.0
+        if display:
+            names = np.array([_flip_name(name) for name in names], dtype=object)
+            utilization = np.round(utilization, 1)
+
+        # Column-at-a-time construction from the cached arrays - no iterrows
+        return pd.DataFrame({
+            'employee_id': self._emp_ids,
+            'employee_name': names,
+            'current_flights': self._workload,
+            'max_flights': self._max_flights,
+            'utilization_pct': utilization
+        })
     
     def test_availability(self, test_flight_start="2025-09-13 10:00", test_flight_end="2025-09-13 14:00"):
         """Test employee availability for a sample flight"""
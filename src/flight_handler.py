@@ -1,16 +1,169 @@
+import io
+
 import pandas as pd
 from datetime import datetime, timedelta
 import numpy as np
 
+# pyarrow's CSV reader tokenizes with SIMD C++ instead of pandas' parser;
+# fall back to pd.read_csv when it isn't installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+# numba is optional, like pyarrow: when present, the turnaround classifier
+# runs as a jitted parallel loop instead of chained np.where passes
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Shared ordered dtype for heaviness - as a category it costs one code byte
+# per row instead of a Python string object
+HEAVINESS_DTYPE = pd.CategoricalDtype(['Light', 'Medium', 'Heavy'], ordered=True)
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _classify_turnaround_codes(turnaround):
+        """Emit heaviness codes (0=Light, 1=Medium, 2=Heavy) in one fused loop"""
+        out = np.empty(turnaround.shape[0], dtype=np.int8)
+        for i in prange(turnaround.shape[0]):
+            t = turnaround[i]
+            if t <= 45:
+                out[i] = 2
+            elif t >= 90:
+                out[i] = 0
+            else:
+                out[i] = 1
+        return out
+else:
+    _classify_turnaround_codes = None
+
 class FlightHandler:
+    # Required ramp team size per heaviness level, shared across instances
+    _TEAM_SIZE = {'Light': 3, 'Medium': 4, 'Heavy': 5}
+
     def __init__(self):
         self.flights_df = None
         
+    @classmethod
+    def from_dataframe(cls, flights_df):
+        """Build a handler around an already-parsed flight DataFrame"""
+        handler = cls()
+        handler.flights_df = flights_df
+        return handler
+
+    @staticmethod
+    def preprocess_to_parquet(csv_path, out_path):
+        """One-time conversion of the flight CSV to typed Parquet"""
+        handler = FlightHandler()
+        if not handler.load_flights(csv_path):
+            return False
+        handler.flights_df.to_parquet(out_path, engine='pyarrow', index=False)
+        return True
+
+    @staticmethod
+    def _parse_times(times, base_date):
+        """Parse an HH:MM time column against a base date.
+
+        Clock strings parse directly to timedeltas on pandas' C path, and
+        the date is applied afterwards as a single Timestamp offset - no
+        per-row date-string concatenation or format inference, and no
+        intermediate datetime column to normalize away.
+        """
+        offsets = pd.to_timedelta(times.astype(str) + ':00', errors='coerce')
+        return pd.Timestamp(base_date) + offsets
+
+    def _compute_turnaround(self):
+        """Compute turnaround_minutes as one vector op on the datetime columns.
+
+        Floor-dividing the timedelta64 difference by a one-minute unit is
+        correct at any datetime64 resolution (pandas may hand back [ns] or
+        [us] depending on how the column was built), and stores int32
+        minutes instead of a float64 Series from .dt.total_seconds(). Rows
+        with an unparsable ETA/ETD get 0, the same default the scheduler
+        uses for missing turnarounds.
+        """
+        eta = self.flights_df['eta_datetime'].to_numpy()
+        etd = self.flights_df['etd_datetime'].to_numpy()
+        valid = ~(np.isnat(eta) | np.isnat(etd))
+        minutes = np.zeros(len(eta), dtype=np.int32)
+        minutes[valid] = ((etd[valid] - eta[valid]) // np.timedelta64(60, 's')).astype(np.int32)
+        self.flights_df['turnaround_minutes'] = minutes
+
+    # CSV columns the pipeline actually consumes; anything else in the file
+    # (including the OO operator and MST columns) is dropped at parse time
+    # instead of parsed and then ignored
+    _CSV_COLUMNS = ('FLT#', 'CTY', 'ETA', 'A/CH', 'FLT#.1', 'CTY.1',
+                    'ETD', 'GATE')
+
+    @staticmethod
+    def _read_csv(file_path):
+        """Read the CSV via pyarrow's typed reader when available"""
+        # Probe just the header, then push the column selection down into
+        # the parser so unknown columns never get tokenized or typed
+        header = pd.read_csv(file_path, nrows=0).columns
+        present = [col for col in FlightHandler._CSV_COLUMNS if col in header]
+
+        # The flight log repeats FLT#/CTY for the outbound leg. pandas
+        # mangles the repeats to FLT#.1/CTY.1 (which is what the probe saw
+        # and what _CSV_COLUMNS names), but pyarrow keeps the raw duplicate
+        # names, so the mangled selection only exists on the pandas side -
+        # take the pandas path whenever the header has duplicates
+        has_duplicates = any(
+            '.' in col
+            and col.rsplit('.', 1)[1].isdigit()
+            and col.rsplit('.', 1)[0] in header
+            for col in header
+        )
+
+        if pacsv is None:
+            return pd.read_csv(file_path, usecols=present or None)
+
+        # Explicit schema skips type inference; ETA/ETD stay strings
+        # because they're combined with the base date downstream. Types are
+        # keyed by raw name, so both columns of a duplicated pair get one.
+        convert_options = pacsv.ConvertOptions(
+            column_types={
+                'ETA': pa.string(),
+                'ETD': pa.string(),
+                'GATE': pa.string(),
+                'CTY': pa.string(),
+            },
+            # The pushdown can only name unique headers; for duplicates the
+            # selection happens after the re-mangle below
+            include_columns=None if has_duplicates else (present or None),
+        )
+        table = pacsv.read_csv(file_path, convert_options=convert_options)
+
+        if has_duplicates:
+            # Re-mangle repeats to pandas form (second FLT# -> FLT#.1) so
+            # the column rename in load_flights sees the same schema from
+            # either reader, then drop the columns the pipeline ignores
+            seen = {}
+            mangled = []
+            for name in table.column_names:
+                n = seen.get(name, 0)
+                seen[name] = n + 1
+                mangled.append(name if n == 0 else f'{name}.{n}')
+            table = table.rename_columns(mangled)
+            if present:
+                table = table.select(present)
+
+        return table.to_pandas()
+
     def load_flights(self, file_path="flights.csv"):
-        """Load flight data from your CSV file"""
+        """Load flight data from your CSV (or preprocessed Parquet/Feather) file"""
         try:
-            # Load the CSV
-            self.flights_df = pd.read_csv(file_path)
+            # Parquet/Feather carry dtypes, so the datetime work below is skipped
+            if file_path.endswith('.parquet'):
+                self.flights_df = pd.read_parquet(file_path, engine='pyarrow')
+            elif file_path.endswith('.feather'):
+                self.flights_df = pd.read_feather(file_path)
+            else:
+                self.flights_df = self._read_csv(file_path)
             
             # Handle your specific column names based on the flight log image
             column_mapping = {
@@ -26,37 +179,52 @@ class FlightHandler:
                 'GATE': 'gate'
             }
             
-            # Rename columns if they exist
-            for old_col, new_col in column_mapping.items():
-                if old_col in self.flights_df.columns:
-                    self.flights_df = self.flights_df.rename(columns={old_col: new_col})
+            # One rename pass - pandas skips mapping keys that aren't present
+            self.flights_df = self.flights_df.rename(columns=column_mapping)
             
+            # Guarantee the display columns exist with sentinel values so
+            # downstream code can index them directly instead of paying a
+            # per-row .get() default on every render
+            for col in ('gate', 'city', 'outbound_city'):
+                if col in self.flights_df.columns:
+                    self.flights_df[col] = self.flights_df[col].fillna('N/A')
+                else:
+                    self.flights_df[col] = 'N/A'
+            if 'outbound_flight' not in self.flights_df.columns:
+                self.flights_df['outbound_flight'] = 'N/A'
+
             # Convert times to datetime if they're in time format
             # Assuming date is 2025-09-13 based on your employee data
             base_date = "2025-09-13"
-            
-            if 'eta' in self.flights_df.columns:
+
+            if 'eta_datetime' in self.flights_df.columns:
+                # Already typed (preprocessed Parquet/Feather) - nothing to parse
+                pass
+            elif 'eta' in self.flights_df.columns:
                 # Handle time format like "5:50", "9:00", "11:29"
-                self.flights_df['eta_datetime'] = pd.to_datetime(
-                    base_date + ' ' + self.flights_df['eta'].astype(str), 
-                    errors='coerce'
+                self.flights_df['eta_datetime'] = self._parse_times(
+                    self.flights_df['eta'], base_date
                 )
-            
-            if 'etd' in self.flights_df.columns:
-                self.flights_df['etd_datetime'] = pd.to_datetime(
-                    base_date + ' ' + self.flights_df['etd'].astype(str), 
-                    errors='coerce'
+
+            if 'etd' in self.flights_df.columns and 'etd_datetime' not in self.flights_df.columns:
+                self.flights_df['etd_datetime'] = self._parse_times(
+                    self.flights_df['etd'], base_date
                 )
-            
+
             # Calculate turnaround time (for determining heaviness)
             if 'eta_datetime' in self.flights_df.columns and 'etd_datetime' in self.flights_df.columns:
-                self.flights_df['turnaround_minutes'] = (
-                    self.flights_df['etd_datetime'] - self.flights_df['eta_datetime']
-                ).dt.total_seconds() / 60
+                self._compute_turnaround()
             
+            # Pre-render HH:MM display strings once so the dashboard
+            # doesn't strftime per row on every rerun
+            self._format_display_times()
+
             # Determine flight heaviness based on turnaround time
             self.add_flight_heaviness()
-            
+
+            # Shrink dtypes - smaller frames serialize faster to the dashboard
+            self._optimize_dtypes()
+
             print("✓ Flight data loaded successfully!")
             print(f"  Total flights: {len(self.flights_df)}")
             print(f"  Columns found: {list(self.flights_df.columns)}")
@@ -75,13 +243,64 @@ class FlightHandler:
             print(f"❌ Error loading flight data: {e}")
             print("Data preview:")
             try:
-                preview_df = pd.read_csv(file_path)
+                # Preview from the first couple of KB only - re-reading the
+                # whole file just failed, no point paying for it twice
+                with open(file_path, 'rb') as f:
+                    head = f.read(2048)
+                preview_df = pd.read_csv(io.BytesIO(head), on_bad_lines='skip', nrows=5)
                 print(preview_df.head())
                 print(f"Columns: {list(preview_df.columns)}")
             except:
                 pass
             return False
     
+    def _format_display_times(self):
+        """Materialize eta_hhmm/etd_hhmm columns with one vectorized strftime pass"""
+        if self.flights_df is None:
+            return
+
+        if 'eta_datetime' in self.flights_df.columns:
+            self.flights_df['eta_hhmm'] = self.flights_df['eta_datetime'].dt.strftime('%H:%M').fillna('N/A')
+        if 'etd_datetime' in self.flights_df.columns:
+            self.flights_df['etd_hhmm'] = self.flights_df['etd_datetime'].dt.strftime('%H:%M').fillna('N/A')
+
+    def _optimize_dtypes(self):
+        """Downcast low-cardinality strings to category and shrink integer columns.
+
+        Category columns dict-encode over Arrow, so the payload sent to the
+        Streamlit frontend shrinks considerably for city/gate/heaviness.
+        """
+        if self.flights_df is None:
+            return
+
+        # Columns nothing downstream reads (still present in frames coming
+        # from older Parquet sidecars or other sources)
+        unused = [c for c in ('outbound_operator', 'mst_time') if c in self.flights_df.columns]
+        if unused:
+            self.flights_df = self.flights_df.drop(columns=unused)
+
+        for col in ('city', 'outbound_city', 'gate', 'aircraft'):
+            if col in self.flights_df.columns and not isinstance(
+                    self.flights_df[col].dtype, pd.CategoricalDtype):
+                self.flights_df[col] = self.flights_df[col].astype('category')
+
+        # Fixed categories so later manual heaviness overrides stay valid
+        if 'heaviness' in self.flights_df.columns:
+            self.flights_df['heaviness'] = self.flights_df['heaviness'].astype(HEAVINESS_DTYPE)
+
+        # Flight ids can be alphanumeric (tail numbers like N1557Y), so a
+        # column is only downcast when every id converts cleanly and the
+        # result stays integral; otherwise it keeps its parsed dtype
+        for col in ('flight_number', 'outbound_flight'):
+            if col not in self.flights_df.columns:
+                continue
+            numeric = pd.to_numeric(
+                self.flights_df[col], downcast='integer', errors='coerce'
+            )
+            lost = numeric.isna() & self.flights_df[col].notna()
+            if not lost.any() and pd.api.types.is_integer_dtype(numeric):
+                self.flights_df[col] = numeric
+
     def add_flight_heaviness(self):
         """Determine flight heaviness - supports both manual and automatic methods"""
         if self.flights_df is None:
@@ -91,22 +310,33 @@ class FlightHandler:
         if 'heaviness' in self.flights_df.columns:
             print("✓ Using manual heaviness from CSV data")
             # Fill any missing values with Medium as default
-            self.flights_df['heaviness'] = self.flights_df['heaviness'].fillna('Medium')
+            self.flights_df['heaviness'] = (
+                self.flights_df['heaviness'].fillna('Medium').astype(HEAVINESS_DTYPE)
+            )
             return
-        
+
         # If no manual heaviness, use automatic estimation as fallback
         print("ℹ No manual heaviness found, using automatic estimation")
         self.flights_df['heaviness'] = 'Medium'  # Default
-        
+
         if 'turnaround_minutes' in self.flights_df.columns:
-            # Classify based on turnaround time (as backup method)
-            conditions = [
-                self.flights_df['turnaround_minutes'] == 60,   # Quick turnaround = Heavy
-                self.flights_df['turnaround_minutes'] == 60,   # Normal turnaround = Medium
-                self.flights_df['turnaround_minutes'] == 60     # Long turnaround = Light
-            ]
-            choices = ['Heavy', 'Medium', 'Light']
-            self.flights_df['heaviness'] = np.select(conditions, choices, default='Medium')
+            # Classify based on turnaround time (as backup method): a quick
+            # turnaround means a heavy workload, a long one a light workload.
+            # Two nested np.where calls scan the column once instead of
+            # np.select evaluating a stack of boolean temporaries.
+            tt = self.flights_df['turnaround_minutes'].to_numpy()
+            if _classify_turnaround_codes is not None:
+                self.flights_df['heaviness'] = pd.Categorical.from_codes(
+                    _classify_turnaround_codes(tt), dtype=HEAVINESS_DTYPE
+                )
+                return
+            self.flights_df['heaviness'] = np.where(
+                tt <= 45, 'Heavy', np.where(tt >= 90, 'Light', 'Medium')
+            )
+
+        # Store the column as int8 category codes immediately - callers like
+        # set_flight_date reach here without going through _optimize_dtypes
+        self.flights_df['heaviness'] = self.flights_df['heaviness'].astype(HEAVINESS_DTYPE)
     
     def set_manual_heaviness_by_city(self, city_heaviness_map):
         """
@@ -125,19 +355,35 @@ class FlightHandler:
         if self.flights_df is None:
             print("❌ No flight data loaded!")
             return
-        
-        # Apply to inbound city
-        for city, heaviness in city_heaviness_map.items():
-            if 'city' in self.flights_df.columns:
-                mask = self.flights_df['city'] == city
-                self.flights_df.loc[mask, 'heaviness'] = heaviness
-                
-            # Also apply to outbound city
-            if 'outbound_city' in self.flights_df.columns:
-                mask = self.flights_df['outbound_city'] == city
-                self.flights_df.loc[mask, 'heaviness'] = heaviness
-        
+
+        self._apply_heaviness_rules(city_heaviness_map, ('city', 'outbound_city'))
         print(f"✓ Manual heaviness applied for {len(city_heaviness_map)} cities")
+
+    def _apply_heaviness_rules(self, mapping, columns):
+        """Apply a {key: heaviness} rule map across the given columns.
+
+        Translates the rules to category codes once, then maps each column
+        in a single hashed pass instead of one boolean mask per (key,
+        column) pair. Later columns override earlier ones, and rows no rule
+        matches keep their existing heaviness.
+        """
+        # Build the hashed lookup once; mapping each column against a Series
+        # reuses its index instead of rebuilding a hash table per column
+        code_series = pd.Series({
+            key: HEAVINESS_DTYPE.categories.get_loc(heaviness)
+            for key, heaviness in mapping.items()
+        }, dtype='float64')
+
+        codes = np.full(len(self.flights_df), -1, dtype='int8')
+        for col in columns:
+            if col in self.flights_df.columns:
+                mapped = self.flights_df[col].map(code_series)
+                hit = mapped.notna().to_numpy()
+                codes[hit] = mapped[hit].astype('int8').to_numpy()
+
+        existing = pd.Categorical(self.flights_df['heaviness'], dtype=HEAVINESS_DTYPE).codes
+        codes = np.where(codes >= 0, codes, existing).astype('int8')
+        self.flights_df['heaviness'] = pd.Categorical.from_codes(codes, dtype=HEAVINESS_DTYPE)
     
     def set_manual_heaviness_by_flight(self, flight_heaviness_map):
         """
@@ -154,16 +400,8 @@ class FlightHandler:
             print("❌ No flight data loaded!")
             return
         
-        for flight_num, heaviness in flight_heaviness_map.items():
-            if 'flight_number' in self.flights_df.columns:
-                mask = self.flights_df['flight_number'] == flight_num
-                self.flights_df.loc[mask, 'heaviness'] = heaviness
-                
-            # Also check outbound flights
-            if 'outbound_flight' in self.flights_df.columns:
-                mask = self.flights_df['outbound_flight'] == flight_num
-                self.flights_df.loc[mask, 'heaviness'] = heaviness
-        
+        # Covers both the arrival and outbound flight-number columns
+        self._apply_heaviness_rules(flight_heaviness_map, ('flight_number', 'outbound_flight'))
         print(f"✓ Manual heaviness applied for {len(flight_heaviness_map)} specific flights")
     
     def set_manual_heaviness_by_aircraft(self, aircraft_heaviness_map):
@@ -182,21 +420,12 @@ class FlightHandler:
             print("❌ No flight data loaded!")
             return
         
-        for aircraft, heaviness in aircraft_heaviness_map.items():
-            if 'aircraft' in self.flights_df.columns:
-                mask = self.flights_df['aircraft'] == aircraft
-                self.flights_df.loc[mask, 'heaviness'] = heaviness
-        
+        self._apply_heaviness_rules(aircraft_heaviness_map, ('aircraft',))
         print(f"✓ Manual heaviness applied for {len(aircraft_heaviness_map)} aircraft types")
     
     def get_team_size_needed(self, heaviness):
         """Determine team size needed based on flight heaviness"""
-        team_size_map = {
-            'Light': 3,
-            'Medium': 4, 
-            'Heavy': 5
-        }
-        return team_size_map.get(heaviness, 4)
+        return self._TEAM_SIZE.get(heaviness, 4)
     
     def show_flight_summary(self):
         """Display summary of flight data"""
@@ -243,7 +472,9 @@ class FlightHandler:
             total_people = count * team_size
             print(f"  {heaviness}: {count} flights ({count/total_flights*100:.1f}%) - {team_size} person teams = {total_people} total positions")
         
-        total_positions = sum(heaviness_counts[h] * self.get_team_size_needed(h) for h in heaviness_counts.index)
+        # One vector multiply over the counts instead of a Python generator
+        sizes = heaviness_counts.index.map(lambda h: self._TEAM_SIZE.get(h, 4)).to_numpy()
+        total_positions = int((heaviness_counts.to_numpy() * sizes).sum())
         print(f"  TOTAL: {total_positions} team positions needed across all flights")
     
     def set_flight_date(self, date_str="2025-09-13"):
@@ -253,24 +484,28 @@ class FlightHandler:
             return
         
         if 'eta' in self.flights_df.columns:
-            self.flights_df['eta_datetime'] = pd.to_datetime(
-                date_str + ' ' + self.flights_df['eta'].astype(str), 
-                errors='coerce'
+            self.flights_df['eta_datetime'] = self._parse_times(
+                self.flights_df['eta'], date_str
             )
-        
+
         if 'etd' in self.flights_df.columns:
-            self.flights_df['etd_datetime'] = pd.to_datetime(
-                date_str + ' ' + self.flights_df['etd'].astype(str), 
-                errors='coerce'
+            self.flights_df['etd_datetime'] = self._parse_times(
+                self.flights_df['etd'], date_str
             )
         
-        # Recalculate turnaround times and heaviness
-        if 'eta_datetime' in self.flights_df.columns and 'etd_datetime' in self.flights_df.columns:
-            self.flights_df['turnaround_minutes'] = (
-                self.flights_df['etd_datetime'] - self.flights_df['eta_datetime']
-            ).dt.total_seconds() / 60
+        # turnaround = etd - eta is invariant under a uniform date shift, so
+        # only derive it (and the heaviness that depends on it) when it
+        # doesn't exist yet. Skipping the recompute also preserves any
+        # manual heaviness overrides across date changes.
+        if ('turnaround_minutes' not in self.flights_df.columns
+                and 'eta_datetime' in self.flights_df.columns
+                and 'etd_datetime' in self.flights_df.columns):
+            self._compute_turnaround()
             self.add_flight_heaviness()
-        
+
+        # Re-render the display strings for the new date
+        self._format_display_times()
+
         print(f"✓ Flight date updated to {date_str}")
 
 # Create sample data based on your flight log image
